@@ -1,20 +1,40 @@
-import json
+import orjson
 import os
+import threading
 import time
+from functools import lru_cache
 from django.conf import settings
 
 # Base directory for all user array data
 BASE_ARRAY_DIR = os.path.join(settings.BASE_DIR, "config", "array_names")
 os.makedirs(BASE_ARRAY_DIR, exist_ok=True)
 
+# User directories already created by this process
+_created_dirs = set()
+_created_dirs_lock = threading.Lock()
+
+# Short-lived cache of directory listings, keyed by user id
+LIST_CACHE_TTL = 2
+_list_cache = {}
+_list_cache_lock = threading.Lock()
+
 
 def _get_user_dir(user):
     """Return the directory path for a specific user."""
     user_dir = os.path.join(BASE_ARRAY_DIR, f"user_{user.id}")
-    os.makedirs(user_dir, exist_ok=True)
+    if user_dir not in _created_dirs:
+        with _created_dirs_lock:
+            os.makedirs(user_dir, exist_ok=True)
+            _created_dirs.add(user_dir)
     return user_dir
 
 
+def _invalidate_listing(user):
+    """Drop the cached directory listing for a user."""
+    with _list_cache_lock:
+        _list_cache.pop(user.id, None)
+
+
 def _get_file_path(user, filename):
     """Return full file path for a specific user and filename."""
     user_dir = _get_user_dir(user)
@@ -27,17 +47,35 @@ def _get_file_path(user, filename):
 def save_array_file(user, filename, array_names):
     """Save array data to a file within the user’s directory."""
     file_path = _get_file_path(user, filename)
-    with open(file_path, "w") as f:
-        json.dump(array_names, f)
+    # Encode up front so the file receives a single write instead of one per token
+    data = orjson.dumps(array_names)
+    with open(file_path, "wb") as f:
+        f.write(data)
+    _invalidate_listing(user)
+
+
+@lru_cache(maxsize=256)
+def _parse_array_file(file_path, mtime_ns):
+    # Keyed on mtime, so a rewritten file is parsed again on its next load
+    with open(file_path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def load_array_file(user, filename):
-    """Load a specific array file from a user’s directory."""
+    """Load a specific array file from a user’s directory (shared, don't mutate)."""
     file_path = _get_file_path(user, filename)
-    if not os.path.exists(file_path):
+    try:
+        return _parse_array_file(file_path, os.stat(file_path).st_mtime_ns)
+    except FileNotFoundError:
         return {}
-    with open(file_path, "r") as f:
-        return json.load(f)
+
+
+def array_file_mtime(user, filename):
+    """Return the modification time of a user's array file, or 0 if it is missing."""
+    try:
+        return os.stat(_get_file_path(user, filename)).st_mtime_ns
+    except FileNotFoundError:
+        return 0
 
 
 # ------------------ FILE MANAGEMENT ------------------
@@ -45,23 +83,42 @@ def load_array_file(user, filename):
 
 def list_user_files(user):
     """List all array files for the given user."""
+    with _list_cache_lock:
+        cached = _list_cache.get(user.id)
+    if cached and time.monotonic() - cached[0] < LIST_CACHE_TTL:
+        return list(cached[1])
+
     user_dir = _get_user_dir(user)
-    return sorted(os.listdir(user_dir))
+    files = sorted(os.listdir(user_dir))
+    with _list_cache_lock:
+        _list_cache[user.id] = (time.monotonic(), files)
+    return list(files)
 
 
 def delete_array_files(user, days=30):
     """Delete user's array files if they haven't been modified for 'days' days."""
     user_dir = _get_user_dir(user)
-    if not user_dir or not os.path.exists(user_dir):
+    now = time.time()
+    deleted = False
+
+    # scandir hands back the stat data with each entry, so no per-file stat call
+    try:
+        with os.scandir(user_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+
+                age_days = (now - entry.stat().st_mtime) / (60 * 60 * 24)
+
+                if age_days > days:
+                    try:
+                        os.remove(entry.path)
+                        deleted = True
+                    except FileNotFoundError:
+                        pass
+    except FileNotFoundError:
         return False
 
-    for filename in os.listdir(user_dir):
-        file_path = os.path.join(user_dir, filename)
-
-        if os.path.isfile(file_path):
-            last_modified = os.path.getmtime(file_path)
-            age_days = (time.time() - last_modified) / (60 * 60 * 24)
-
-            if age_days > days:
-                os.remove(file_path)
-                return True
+    if deleted:
+        _invalidate_listing(user)
+    return deleted
@@ -1,3 +1,85 @@
+from unittest import mock
+
 from django.test import TestCase
+from django.urls import reverse
+
+from analytics import views
+
+
+class FixedMountSimulationTests(TestCase):
+    task_id = "4d1f6c2e-task"
+
+    def _start_tracking(self):
+        session = self.client.session
+        session["simulation_task_id"] = self.task_id
+        session.save()
+
+    def _mock_result(self, successful=False, failed=False, result=None):
+        task = mock.Mock(state="PENDING", result=result)
+        task.successful.return_value = successful
+        task.failed.return_value = failed
+        return task
+
+    @mock.patch("analytics.views.array_storage.save_array_file")
+    @mock.patch("analytics.views.tasks.run_fixed_mount_simulation.delay")
+    def test_post_enqueues_simulation(self, delay, save_array_file):
+        delay.return_value = mock.Mock(id=self.task_id)
+
+        response = self.client.post(
+            reverse("fixed_mount_system"), {"name": "Roof", "lat": "-1.29"}
+        )
+
+        delay.assert_called_once()
+        location_params = delay.call_args.args[0]
+        self.assertEqual(location_params["name"], "Roof")
+        self.assertEqual(location_params["lat"], "-1.29")
+        self.assertEqual(self.client.session["simulation_task_id"], self.task_id)
+        self.assertRedirects(
+            response,
+            reverse("simulation_status", kwargs={"task_id": self.task_id}),
+            fetch_redirect_response=False,
+        )
+
+    @mock.patch("analytics.views.celery_app.AsyncResult")
+    def test_status_redirects_to_result_on_success(self, async_result):
+        async_result.return_value = self._mock_result(successful=True, result=42)
+        self._start_tracking()
+
+        response = self.client.get(
+            reverse("simulation_status", kwargs={"task_id": self.task_id})
+        )
+
+        async_result.assert_called_once_with(self.task_id)
+        self.assertRedirects(
+            response,
+            reverse("modelchain_result", kwargs={"token": views.SIGNER.sign(42)}),
+            fetch_redirect_response=False,
+        )
+        self.assertNotIn("simulation_task_id", self.client.session)
+
+    @mock.patch("analytics.views.celery_app.AsyncResult")
+    def test_status_redirects_to_form_on_failure(self, async_result):
+        async_result.return_value = self._mock_result(
+            failed=True, result=ValueError("bad module")
+        )
+        self._start_tracking()
+
+        response = self.client.get(
+            reverse("simulation_status", kwargs={"task_id": self.task_id})
+        )
+
+        self.assertRedirects(
+            response, reverse("fixed_mount_system"), fetch_redirect_response=False
+        )
+        self.assertNotIn("simulation_task_id", self.client.session)
+
+    @mock.patch("analytics.views.celery_app.AsyncResult")
+    def test_status_ignores_untracked_task(self, async_result):
+        response = self.client.get(
+            reverse("simulation_status", kwargs={"task_id": self.task_id})
+        )
 
-# Create your tests here.
+        async_result.assert_not_called()
+        self.assertRedirects(
+            response, reverse("fixed_mount_system"), fetch_redirect_response=False
+        )
@@ -17,6 +17,11 @@ urlpatterns = [
     path(
         "fixed-mount-system/", views.fixed_mount_system_view, name="fixed_mount_system"
     ),
+    path(
+        "simulation-status/<str:task_id>/",
+        views.simulation_status_view,
+        name="simulation_status",
+    ),
     path("axis-tracking/", views.axis_tracking_view, name="axis_tracking"),
     path(
         "spec-sheet-modelling/",
@@ -40,4 +45,5 @@ urlpatterns = [
     path("repository/", views.repository_view, name="repo"),
     path("module_search/", views.module_search, name="module_search"),
     path("inverter_search/", views.inverter_search, name="inverter_search"),
+    path("irradiance-ohlc/", views.irradiance_ohlc, name="irradiance_ohlc"),
 ]
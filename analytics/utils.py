@@ -3,47 +3,191 @@
 
 from django.conf import settings
 import plotly.graph_objects as go
-from plotly.offline import plot
-from typing import Dict
+from data_factory.pvlib.utils import DARK_TEMPLATE
+from typing import Dict, List, NamedTuple
+from functools import lru_cache
+from bisect import bisect_left, bisect_right
 import logging
-import json
+import mmap
 import os
+import orjson
 import calendar
+import uuid
 import pandas as pd
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Snapshot of calendar.month_abbr, which re-formats on every subscript
+_MONTH_ABBR = tuple(calendar.month_abbr)
+
+# Same markup Plotly emits for full_html=False, filled in directly per chart
+_CHART_DIV = (
+    '<div><div id="{div_id}" class="plotly-graph-div" '
+    'style="height:100%; width:100%;"></div>'
+    '<script type="text/javascript">'
+    "window.PLOTLYENV=window.PLOTLYENV || {{}};"
+    'if (document.getElementById("{div_id}")) {{'
+    'Plotly.newPlot("{div_id}", {data}, {layout}, {{"responsive": true}})'
+    "}};</script></div>"
+)
+
+# Characters that must not appear raw inside an inline <script>
+_SCRIPT_ESCAPES = (
+    ("<", "\\u003c"),
+    (">", "\\u003e"),
+    ("/", "\\u002f"),
+    ("\u2028", "\\u2028"),
+    ("\u2029", "\\u2029"),
+)
+
+
+def _json_default(obj):
+    """Fallback for values orjson can't encode natively."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _script_json(obj):
+    text = orjson.dumps(
+        obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+    for char, escaped in _SCRIPT_ESCAPES:
+        text = text.replace(char, escaped)
+    return text
+
+
+def _encode_figure(fig):
+    """Script-safe (data, layout) JSON strings for a figure."""
+    spec = fig.to_plotly_json()
+    return _script_json(spec["data"]), _script_json(spec["layout"])
+
+
+def _chart_div(encoded):
+    data, layout = encoded
+    return _CHART_DIV.format(div_id=uuid.uuid4().hex, data=data, layout=layout)
+
+
+def render_chart(fig):
+    """Render a figure to an embeddable div without Plotly's HTML builder."""
+    return _chart_div(_encode_figure(fig))
+
+
+def chart_bundle(charts):
+    """
+    Join pre-encoded figure JSON strings into one JSON object, escaped for an
+    inline <script> block, so pages embed it without re-encoding per request.
+    """
+    text = (
+        "{"
+        + ",".join(
+            f"{orjson.dumps(name).decode()}:{figure}" for name, figure in charts.items()
+        )
+        + "}"
+    )
+    for char, escaped in _SCRIPT_ESCAPES:
+        text = text.replace(char, escaped)
+    return text
+
 
+def _load_json_mmap(path):
+    """Parse a large JSON file straight from a read-only memory map."""
+    with open(path, mode="rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+@lru_cache(maxsize=1)
 def load_locations():
     path = os.path.join(settings.BASE_DIR, "config", "locations.json")
 
-    with open(path, mode="r") as f:
-        locations = json.load(f)
-        return locations
+    with open(path, mode="rb") as f:
+        return orjson.loads(f.read())
 
 
+@lru_cache(maxsize=1)
 def load_CEC_modules():
     path = os.path.join(settings.BASE_DIR, "config", "cec_modules.json")
-
-    with open(path, mode="r") as f:
-        modules = json.load(f)
-        return modules
+    return _load_json_mmap(path)
 
 
+@lru_cache(maxsize=1)
 def load_CEC_inverters():
     path = os.path.join(settings.BASE_DIR, "config", "cec_inverters.json")
+    return _load_json_mmap(path)
+
+
+class CatalogIndex(NamedTuple):
+    frame: pd.DataFrame
+    # Lowercased names in sorted order, and their row positions in frame
+    sorted_names: List[str]
+    order: np.ndarray
+
+
+def _search_index(catalog):
+    frame = pd.DataFrame(
+        {"name": list(catalog.keys()), "manufacturer": list(catalog.values())}
+    )
+    # Arrow-backed strings keep the substring scan in native code
+    frame["name_lc"] = frame["name"].astype("string[pyarrow]").str.lower()
 
-    with open(path, mode="r") as f:
-        inverters = json.load(f)
-        return inverters
+    names_lc = frame["name_lc"].to_numpy(dtype=object)
+    order = np.argsort(names_lc, kind="stable")
+    return CatalogIndex(frame, names_lc[order].tolist(), order)
+
+
+@lru_cache(maxsize=1)
+def CEC_module_index():
+    """Module catalog index with lowercased names for searching."""
+    return _search_index(load_CEC_modules())
+
+
+@lru_cache(maxsize=1)
+def CEC_inverter_index():
+    """Inverter catalog index with lowercased names for searching."""
+    return _search_index(load_CEC_inverters())
+
+
+def search_catalog(index, query, limit=50):
+    """
+    Return up to `limit` catalog entries whose name contains `query`.
+    Prefix matches come first and are found by bisecting the sorted names;
+    the substring scan only runs when they don't fill the limit.
+    """
+    lo = bisect_left(index.sorted_names, query)
+    hi = bisect_right(index.sorted_names, query + "\U0010ffff", lo)
+    rows = index.order[lo : min(hi, lo + limit)]
+
+    if len(rows) < limit:
+        mask = index.frame["name_lc"].str.contains(query, regex=False, na=False)
+        extra = np.flatnonzero(mask.to_numpy(dtype=bool))
+        extra = extra[~np.isin(extra, rows)]
+        rows = np.concatenate([rows, extra[: limit - len(rows)]])
+
+    return index.frame.iloc[rows][["name", "manufacturer"]].to_dict("records")
 
 
 def monthly_savings_chart(monthly_savings: Dict):
-    # Sort months (1–12) and map to names
-    months = sorted(map(int, monthly_savings.keys()))
-    month_names = [calendar.month_abbr[m] for m in months]
-    savings = [monthly_savings[str(m)] for m in months]
+    # Scenarios often share a rate structure, so the encoded figure is memoized;
+    # each call still gets its own div id
+    return _chart_div(_monthly_savings_figure(tuple(monthly_savings.items())))
+
+
+@lru_cache(maxsize=128)
+def _monthly_savings_figure(monthly_items):
+    monthly_savings = dict(monthly_items)
+
+    # Sort months (1–12) and map to names; keys may be ints or JSON strings
+    count = len(monthly_savings)
+    months = np.fromiter(map(int, monthly_savings.keys()), dtype=np.int8, count=count)
+    order = np.argsort(months)
+    savings = np.fromiter(monthly_savings.values(), dtype=np.float64, count=count)
+    savings = savings[order]
+    month_names = [_MONTH_ABBR[m] for m in months[order].tolist()]
 
     # Create line chart
     fig = go.Figure(
@@ -57,12 +201,10 @@ def monthly_savings_chart(monthly_savings: Dict):
         yaxis_title="Savings",
         xaxis=dict(tickmode="array", tickvals=month_names),
         xaxis_rangeslider_visible=False,
-        template="plotly_dark",
+        template=DARK_TEMPLATE,
     )
 
-    # Convert figure to HTML div
-    savings_chart = plot(fig, output_type="div", include_plotlyjs=False)
-    return savings_chart
+    return _encode_figure(fig)
 
 
 def scenario_efficiency_chart(scenario_data: Dict):
@@ -94,8 +236,8 @@ def scenario_efficiency_chart(scenario_data: Dict):
     )
 
     fig.update_layout(
-        xaxis_title="Efficiency Ratio", yaxis_title="Annual kWh", template="plotly_dark"
+        xaxis_title="Efficiency Ratio", yaxis_title="Annual kWh", template=DARK_TEMPLATE
     )
 
-    efficiency_chart = plot(fig, output_type="div", include_plotlyjs=False)
+    efficiency_chart = render_chart(fig)
     return efficiency_chart
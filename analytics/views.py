@@ -2,74 +2,188 @@
 ## pkibuka@milky-way.space
 
 from django.shortcuts import render, redirect
-from django.http import JsonResponse
+from django.http import HttpResponse, HttpResponseNotModified
 from django.conf import settings
 from django.contrib import messages
 from django.core.cache import cache
 from django.core.signing import Signer
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
 from data_factory.database.manager import DataManager
 from data_factory.database.connection import DatabaseConnection
 from data_factory.pvwatts.simulator import PVWattsSimulator
 from data_factory.pvlib import (
-    fixed_mount_simulator,
     specs_simulator,
     bifacial_simulation,
     axis_tracking,
 )
 from data_factory.pvlib import general_analyzer, seasonal_analyzer, financial_analysis
 from data_factory.pvlib import plots, timeseries
-from data_factory import weather_analyzer, airquality_analyzer
+from data_factory import weather_analyzer, airquality_analyzer, tasks, celery_app
 from analytics import utils, array_storage
-import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+import hashlib
 import logging
+import orjson
+import pandas as pd
+import uuid
 
 logger = logging.getLogger(__name__)
 
+# Columns modelchain_result_view's charts and analyzers read, per result key
+MODELCHAIN_RESULT_COLUMNS = {
+    "ac_aoi": ["ac", "aoi", "aoi_modifier"],
+    "cell_temperature": ["temperature"],
+    "dc": ["i_sc", "v_oc", "i_mp", "v_mp", "p_mp", "i_x", "i_xx"],
+    "diode_params": ["i_l", "i_o", "r_s", "r_sh", "nnsvth"],
+    "irradiance": [
+        "poa_global",
+        "poa_direct",
+        "poa_diffuse",
+        "poa_sky_diffuse",
+        "poa_ground_diffuse",
+    ],
+    "solar_position": [
+        "zenith",
+        "azimuth",
+        "elevation",
+        "apparent_zenith",
+        "apparent_elevation",
+        "equation_of_time",
+    ],
+    "weather": ["ghi", "dni", "dhi", "temp_air", "wind_speed"],
+}
+
+# Shorter queries match most of the catalog, so they are not searched
+MIN_SEARCH_QUERY = 2
+
+# time_bucket intervals the irradiance OHLC endpoint accepts
+OHLC_BUCKETS = {"1d": "1 day", "1w": "1 week", "1m": "1 month"}
+MAX_OHLC_POINTS = 2000
+
+# Bump when the shape of cached modelchain data, PlotData or chart output changes,
+# so entries written by older code are never read back
+MC_CACHE_SCHEMA = "s3"
+
+# Chart and analyzer work is mostly pandas/numpy, which releases the GIL
+ANALYTICS_POOL = ThreadPoolExecutor(max_workers=settings.ANALYTICS_THREADS)
+
+# Signs the modelchain result ids handed to the browser
+SIGNER = Signer()
+
+# Simulation form fields passed through to the simulators under the same name
+SITE_FIELDS = ("lat", "lon", "alt", "tz", "albedo")
+CATALOG_SYSTEM_FIELDS = (
+    "module",
+    "module_type",
+    "inverter",
+    "modules_per_string",
+    "strings",
+    "temp_model",
+    "temp_model_params",
+    "year",
+)
+LOSSES_FIELDS = (
+    "soiling",
+    "shading",
+    "snow",
+    "mismatch",
+    "wiring",
+    "connections",
+    "lid",
+    "nameplate",
+    "age",
+    "availability",
+)
 
-def index_view(request):
-    locations = utils.load_locations()
-    conn = DatabaseConnection()
-    dbm = DataManager(conn)
-    df = dbm.get_irradiance_ohlc_data(bucket="1 week")
+# Module and inverter datasheet values on the spec-sheet form
+SPEC_SHEET_NUMERIC_FIELDS = {
+    "pdc0": float,
+    "v_mp": float,
+    "i_mp": float,
+    "v_oc": float,
+    "i_sc": float,
+    "Isc": float,
+    "voc": float,
+    "Pmax": float,
+    "pdc": float,
+    "eta_inv_nom": float,
+    "eta_inv_ref": float,
+}
+
+LOCATION_FIELDS = ("locations[][name]", "locations[][lat]", "locations[][lon]")
+
+
+def _parse_numeric(post, fields):
+    """Coerce the given POST fields to their types, naming the first invalid one."""
+    values = {}
+    for field, cast in fields.items():
+        try:
+            values[field] = cast(post[field])
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid value for '{field}'") from None
+    return values
+
+
+def _parse_locations(post):
+    """Zip the parallel locations[][name|lat|lon] POST lists into location dicts."""
+    names, lats, lons = map(post.getlist, LOCATION_FIELDS)
+
+    return [
+        {"name": name, "lat": lat, "lon": lon}
+        for name, lat, lon in zip(names, lats, lons)
+        if name and lat and lon
+    ]
+
+
+@dataclass(frozen=True)
+class TimeseriesParams:
+    """Time-series chart selections read from the modelchain result query string."""
+
+    ac_aoi_param: str = "ac"
+    ac_aoi_array: int = 0
+    cell_temp_array: int = 0
+    dc_output_param: str = "i_sc"
+    dc_output_array: int = 0
+    diode_params_param: str = "i_l"
+    diode_params_array: int = 0
+    irradiance_param: str = "poa_global"
+    irradiance_array: int = 0
+    weather_param: str = "temp_air"
+
+    @classmethod
+    def from_query(cls, query):
+        values = {
+            field.name: field.type(query[field.name])
+            for field in fields(cls)
+            if field.name in query
+        }
+        # Diode parameter columns are stored lowercase
+        if "diode_params_param" in values:
+            values["diode_params_param"] = values["diode_params_param"].lower()
+        return cls(**values)
 
-    if df.empty:
-        irradiance_chart = "<p>No data available</p>"
-
-    else:
-        df.dropna(subset=["open", "high", "low", "close"], how="all", inplace=True)
-
-        fig = go.Figure(
-            data=[
-                go.Candlestick(
-                    x=df["bucket"],
-                    open=df["open"],
-                    high=df["high"],
-                    low=df["low"],
-                    close=df["close"],
-                )
-            ]
-        )
 
-        fig.update_layout(
-            xaxis_title="Date",
-            yaxis_title="kWh/m²/day",
-            xaxis_rangeslider_visible=False,
-            template="plotly_dark",
-        )
+def _parallel_map(tasks):
+    """Run {name: (fn, *args)} on ANALYTICS_POOL and return {name: result}."""
+    futures = {
+        name: ANALYTICS_POOL.submit(fn, *args) for name, (fn, *args) in tasks.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
 
-        irradiance_chart = plot(fig, output_type="div", include_plotlyjs=False)
 
-    context = {
-        "locations": locations,
-        "irradiance_chart": irradiance_chart,
-    }
+def index_view(request):
+    locations = utils.load_locations()
+    context = {"locations": locations}
     return render(request, "analytics/index.html", context)
 
 
 def pvwatts_modelling_view(request):
     simulator = PVWattsSimulator()
     reports = []
-    location_idx = 0
 
     if request.method == "POST":
         # Get system config parameters
@@ -83,22 +197,23 @@ def pvwatts_modelling_view(request):
             "timeframe": request.POST.get("timeframe", "hourly"),
         }
 
-        while True:
-            loc_name = request.POST.get(f"locations[{location_idx}][name]")
-            lat = request.POST.get(f"locations[{location_idx}][lat]")
-            lon = request.POST.get(f"locations[{location_idx}][lon]")
+        locations = _parse_locations(request.POST)
 
-            # Stop looping if no more locations in POST data
-            if not (loc_name and lat and lon):
-                break
+        for location in locations:
+            simulator.add_location(
+                name=location["name"],
+                lat=float(location["lat"]),
+                lon=float(location["lon"]),
+            )
 
-            simulator.add_location(name=loc_name, lat=float(lat), lon=float(lon))
-            report = simulator.generate_report(loc_name, config=system_config)
-            reports.append(report)
-
-            location_idx += 1
+        reports = simulator.generate_reports(
+            [location["name"] for location in locations], config=system_config
+        )
 
-        request.session["pvwatts_report"] = reports
+        # Keep the (large) reports in the cache; the session only carries the key
+        report_key = f"pvwatts_report_{uuid.uuid4().hex}"
+        cache.set(report_key, reports, timeout=3600)
+        request.session["pvwatts_report_key"] = report_key
         logger.debug(reports)
         return redirect("pvwatts_report")
 
@@ -107,21 +222,26 @@ def pvwatts_modelling_view(request):
 
 
 def pvwatts_report_view(request):
-    reports = request.session.get("pvwatts_report")
+    report_key = request.session.get("pvwatts_report_key")
+    reports = cache.get(report_key) if report_key else None
 
     if not reports:
         return redirect("pvwatts_modelling")
 
-    savings_chart = None
-
-    for report in reports:
-        monthly_savings = report["financial_analysis"]["monthly_savings_breakdown"]
-        savings_chart = utils.monthly_savings_chart(monthly_savings)
-        report["savings_chart"] = savings_chart
+    # Charts are independent per report, so build them concurrently
+    chart_tasks = {}
+    for idx, report in enumerate(reports):
+        chart_tasks[idx, "savings_chart"] = (
+            utils.monthly_savings_chart,
+            report["financial_analysis"]["monthly_savings_breakdown"],
+        )
+        chart_tasks[idx, "efficiency_chart"] = (
+            utils.scenario_efficiency_chart,
+            report["scenario_analysis"],
+        )
 
-        scenario_data = report["scenario_analysis"]
-        efficiency_chart = utils.scenario_efficiency_chart(scenario_data)
-        report["efficiency_chart"] = efficiency_chart
+    for (idx, chart), html in _parallel_map(chart_tasks).items():
+        reports[idx][chart] = html
 
     context = {
         "reports": reports,
@@ -131,14 +251,12 @@ def pvwatts_report_view(request):
 
 
 def fixed_mount_system_view(request):
-    conn = DatabaseConnection()
-    db = DataManager(conn)
-
     if request.method == "POST":
-        simulation_name = request.POST.get("name", "Fixed_Mount")
-        description = request.POST.get("description")
+        post = request.POST.dict()
+        simulation_name = post.get("name", "Fixed_Mount")
+        description = post.get("description")
         arrays_file = request.FILES.get("arrays_json")
-        arrays_config = json.load(arrays_file) if arrays_file else {}
+        arrays_config = orjson.loads(arrays_file.read()) if arrays_file else []
 
         array_names = {}
 
@@ -154,74 +272,72 @@ def fixed_mount_system_view(request):
 
         location_params = {
             "name": simulation_name,
-            "lat": request.POST.get("lat"),
-            "lon": request.POST.get("lon"),
-            "alt": request.POST.get("alt"),
-            "tz": request.POST.get("tz"),
-            "albedo": request.POST.get("albedo"),
+            **{field: post.get(field) for field in SITE_FIELDS},
         }
 
         system_params = {
-            "module": request.POST.get("module"),
-            "module_type": request.POST.get("module_type"),
-            "inverter": request.POST.get("inverter"),
-            "surface_azimuth": request.POST.get("azimuth"),
-            "surface_tilt": request.POST.get("tilt"),
-            "modules_per_string": request.POST.get("modules_per_string"),
-            "strings": request.POST.get("strings"),
-            "temp_model": request.POST.get("temp_model"),
-            "temp_model_params": request.POST.get("temp_model_params"),
+            **{field: post.get(field) for field in CATALOG_SYSTEM_FIELDS},
+            "surface_azimuth": post.get("azimuth"),
+            "surface_tilt": post.get("tilt"),
             "arrays_config": arrays_config,
-            "description": request.POST.get("description", ""),
-            "year": request.POST.get("year"),
+            "description": post.get("description", ""),
         }
 
-        losses_params = {
-            "soiling": request.POST.get("soiling"),
-            "shading": request.POST.get("shading"),
-            "snow": request.POST.get("snow"),
-            "mismatch": request.POST.get("mismatch"),
-            "wiring": request.POST.get("wiring"),
-            "connections": request.POST.get("connections"),
-            "lid": request.POST.get("lid"),
-            "nameplate": request.POST.get("nameplate"),
-            "age": request.POST.get("age"),
-            "availability": request.POST.get("availability"),
-        }
+        losses_params = {field: post.get(field) for field in LOSSES_FIELDS}
 
-        fms = fixed_mount_simulator.FixedMountSimulator(
-            location_params=location_params,
-            system_params=system_params,
-            losses_params=losses_params,
-        )
-
-        result = fms.run_simulation()
-        result_id = db.save_modelchain_result(
-            result=result,
-            array_names=array_names,
-            simulation_name=simulation_name,
-            description=description,
+        # ModelChain runs take seconds to minutes, so they run on a worker
+        task = tasks.run_fixed_mount_simulation.delay(
+            location_params,
+            system_params,
+            losses_params,
+            array_names,
+            simulation_name,
+            description,
         )
 
-        db.close()
+        request.session["simulation_task_id"] = task.id
         messages.success(request, f"Configured system with {len(arrays_config)} arrays")
-        signer = Signer()
-        token = signer.sign(result_id)
-        return redirect("modelchain_result", token=token)
+        return redirect("simulation_status", task_id=task.id)
 
     context = {}
     return render(request, "analytics/fixed_mount_system.html", context)
 
 
-def spec_sheet_modelling_view(request):
-    conn = DatabaseConnection()
-    db = DataManager(conn)
+def simulation_status_view(request, task_id):
+    if task_id != request.session.get("simulation_task_id"):
+        return redirect("fixed_mount_system")
+
+    task = celery_app.AsyncResult(task_id)
+
+    if task.successful():
+        del request.session["simulation_task_id"]
+        token = SIGNER.sign(task.result)
+        return redirect("modelchain_result", token=token)
 
+    if task.failed():
+        del request.session["simulation_task_id"]
+        logger.error(f"Simulation {task_id} failed: {task.result}")
+        messages.error(request, "Simulation failed, please check the system parameters")
+        return redirect("fixed_mount_system")
+
+    context = {"task_state": task.state}
+    return render(request, "analytics/simulation_status.html", context)
+
+
+def spec_sheet_modelling_view(request):
     if request.method == "POST":
-        simulation_name = request.POST.get("name", "Spec_Sheet")
-        description = request.POST.get("description")
+        post = request.POST.dict()
+        simulation_name = post.get("name", "Spec_Sheet")
+        description = post.get("description")
+
+        try:
+            specs = _parse_numeric(post, SPEC_SHEET_NUMERIC_FIELDS)
+        except ValueError as e:
+            messages.error(request, str(e))
+            return redirect("spec_sheet_modelling")
+
         arrays_file = request.FILES.get("arrays_json")
-        arrays_config = json.load(arrays_file) if arrays_file else {}
+        arrays_config = orjson.loads(arrays_file.read()) if arrays_file else []
 
         array_names = {}
 
@@ -237,33 +353,23 @@ def spec_sheet_modelling_view(request):
 
         location_params = {
             "name": simulation_name,
-            "lat": request.POST.get("lat"),
-            "lon": request.POST.get("lon"),
-            "alt": request.POST.get("alt"),
-            "tz": request.POST.get("tz"),
-            "albedo": request.POST.get("albedo"),
+            **{field: post.get(field) for field in SITE_FIELDS},
         }
 
         module_params = {
-            "pdc0": float(request.POST.get("pdc0")),
-            "v_mp": float(request.POST.get("v_mp")),
-            "i_mp": float(request.POST.get("i_mp")),
-            "v_oc": float(request.POST.get("v_oc")),
-            "i_sc": float(request.POST.get("i_sc")),
+            field: specs[field] for field in ("pdc0", "v_mp", "i_mp", "v_oc", "i_sc")
         }
 
         temp_coefficients = {
-            "alpha_sc": (float(request.POST.get("Isc")) / 100)
-            * float(request.POST.get("i_sc")),
-            "beta_voc": (float(request.POST.get("voc")) / 100)
-            * float(request.POST.get("v_oc")),
-            "gamma_pmp": float(request.POST.get("Pmax")),
+            "alpha_sc": specs["Isc"] / 100 * specs["i_sc"],
+            "beta_voc": specs["voc"] / 100 * specs["v_oc"],
+            "gamma_pmp": specs["Pmax"],
         }
 
         inverter_params = {
-            "pdc0": float(request.POST.get("pdc")),
-            "eta_inv_nom": float(request.POST.get("eta_inv_nom")),
-            "eta_inv_ref": float(request.POST.get("eta_inv_ref")),
+            "pdc0": specs["pdc"],
+            "eta_inv_nom": specs["eta_inv_nom"],
+            "eta_inv_ref": specs["eta_inv_ref"],
         }
 
         system_params = {
@@ -271,30 +377,19 @@ def spec_sheet_modelling_view(request):
             "module_params": module_params,
             "temp_coefficients": temp_coefficients,
             "inverter_params": inverter_params,
-            "module_type": request.POST.get("module_type", "glass_glass"),
-            "celltype": request.POST.get("celltype", "monoSi"),
-            "surface_azimuth": request.POST.get("azimuth"),
-            "surface_tilt": request.POST.get("tilt"),
-            "modules_per_string": request.POST.get("modules_per_string"),
-            "strings": request.POST.get("strings"),
-            "temp_model": request.POST.get("temp_model"),
-            "temp_model_params": request.POST.get("temp_model_params"),
-            "description": request.POST.get("description"),
-            "year": request.POST.get("year"),
+            "module_type": post.get("module_type", "glass_glass"),
+            "celltype": post.get("celltype", "monoSi"),
+            "surface_azimuth": post.get("azimuth"),
+            "surface_tilt": post.get("tilt"),
+            "modules_per_string": post.get("modules_per_string"),
+            "strings": post.get("strings"),
+            "temp_model": post.get("temp_model"),
+            "temp_model_params": post.get("temp_model_params"),
+            "description": post.get("description"),
+            "year": post.get("year"),
         }
 
-        losses_params = {
-            "soiling": request.POST.get("soiling"),
-            "shading": request.POST.get("shading"),
-            "snow": request.POST.get("snow"),
-            "mismatch": request.POST.get("mismatch"),
-            "wiring": request.POST.get("wiring"),
-            "connections": request.POST.get("connections"),
-            "lid": request.POST.get("lid"),
-            "nameplate": request.POST.get("nameplate"),
-            "age": request.POST.get("age"),
-            "availability": request.POST.get("availability"),
-        }
+        losses_params = {field: post.get(field) for field in LOSSES_FIELDS}
 
         sss = specs_simulator.SpecSheetSimulator(
             location_params=location_params,
@@ -303,17 +398,16 @@ def spec_sheet_modelling_view(request):
         )
 
         result = sss.run_simulation()
-        result_id = db.save_modelchain_result(
-            result=result,
-            array_names=array_names,
-            simulation_name=simulation_name,
-            description=description,
-        )
+        with DataManager(DatabaseConnection()) as db:
+            result_id = db.save_modelchain_result(
+                result=result,
+                array_names=array_names,
+                simulation_name=simulation_name,
+                description=description,
+            )
 
-        db.close()
         messages.success(request, f"Configured system with {len(arrays_config)} arrays")
-        signer = Signer()
-        token = signer.sign(result_id)
+        token = SIGNER.sign(result_id)
         return redirect("modelchain_result", token=token)
 
     context = {}
@@ -321,14 +415,12 @@ def spec_sheet_modelling_view(request):
 
 
 def axis_tracking_view(request):
-    conn = DatabaseConnection()
-    db = DataManager(conn)
-
     if request.method == "POST":
-        simulation_name = request.POST.get("name", "Single_Dual_Axis_Tracking")
-        description = request.POST.get("description")
+        post = request.POST.dict()
+        simulation_name = post.get("name", "Single_Dual_Axis_Tracking")
+        description = post.get("description")
         arrays_file = request.FILES.get("arrays_json")
-        arrays_config = json.load(arrays_file) if arrays_file else {}
+        arrays_config = orjson.loads(arrays_file.read()) if arrays_file else []
 
         array_names = {}
 
@@ -343,53 +435,31 @@ def axis_tracking_view(request):
         )
 
         timeframe_params = {
-            "start_date": request.POST.get("start_date"),
-            "end_date": request.POST.get("end_date"),
-            "timeframe": request.POST.get("timeframe", "hourly"),
+            "start_date": post.get("start_date"),
+            "end_date": post.get("end_date"),
+            "timeframe": post.get("timeframe", "hourly"),
         }
 
         location_params = {
             "name": simulation_name,
-            "lat": request.POST.get("lat"),
-            "lon": request.POST.get("lon"),
-            "alt": request.POST.get("alt"),
-            "tz": request.POST.get("tz"),
-            "albedo": request.POST.get("albedo"),
+            **{field: post.get(field) for field in SITE_FIELDS},
         }
 
         system_params = {
             "arrays_config": arrays_config,
-            "module": request.POST.get("module"),
-            "module_type": request.POST.get("module_type"),
-            "inverter": request.POST.get("inverter"),
-            "modules_per_string": request.POST.get("modules_per_string"),
-            "strings": request.POST.get("strings"),
-            "temp_model": request.POST.get("temp_model"),
-            "temp_model_params": request.POST.get("temp_model_params"),
-            "description": request.POST.get("description"),
-            "year": request.POST.get("year"),
+            **{field: post.get(field) for field in CATALOG_SYSTEM_FIELDS},
+            "description": description,
         }
 
         tracking_params = {
-            "axis_azimuth": request.POST.get("azimuth"),
-            "axis_tilt": request.POST.get("tilt"),
-            "max_angle": request.POST.get("max_angle"),
-            "backtrack": request.POST.get("backtrack"),
-            "gcr": request.POST.get("gcr"),
+            "axis_azimuth": post.get("azimuth"),
+            "axis_tilt": post.get("tilt"),
+            "max_angle": post.get("max_angle"),
+            "backtrack": post.get("backtrack"),
+            "gcr": post.get("gcr"),
         }
 
-        losses_params = {
-            "soiling": request.POST.get("soiling"),
-            "shading": request.POST.get("shading"),
-            "snow": request.POST.get("snow"),
-            "mismatch": request.POST.get("mismatch"),
-            "wiring": request.POST.get("wiring"),
-            "connections": request.POST.get("connections"),
-            "lid": request.POST.get("lid"),
-            "nameplate": request.POST.get("nameplate"),
-            "age": request.POST.get("age"),
-            "availability": request.POST.get("availability"),
-        }
+        losses_params = {field: post.get(field) for field in LOSSES_FIELDS}
 
         sdt = axis_tracking.SingleDualAxisTracker(
             location_params=location_params,
@@ -399,17 +469,16 @@ def axis_tracking_view(request):
         )
 
         result = sdt.run_simulation()
-        result_id = db.save_modelchain_result(
-            result=result,
-            array_names=array_names,
-            simulation_name=simulation_name,
-            description=description,
-        )
+        with DataManager(DatabaseConnection()) as db:
+            result_id = db.save_modelchain_result(
+                result=result,
+                array_names=array_names,
+                simulation_name=simulation_name,
+                description=description,
+            )
 
-        db.close()
         messages.success(request, f"Configured system with {len(arrays_config)} arrays")
-        signer = Signer()
-        token = signer.sign(result_id)
+        token = SIGNER.sign(result_id)
         return redirect("modelchain_result", token=token)
 
     context = {}
@@ -417,14 +486,12 @@ def axis_tracking_view(request):
 
 
 def bifacial_system_view(request):
-    conn = DatabaseConnection()
-    db = DataManager(conn)
-
     if request.method == "POST":
-        simulation_name = request.POST.get("name", "Bifacial_System")
-        description = request.POST.get("description")
+        post = request.POST.dict()
+        simulation_name = post.get("name", "Bifacial_System")
+        description = post.get("description")
         arrays_file = request.FILES.get("arrays_json")
-        arrays_config = json.load(arrays_file) if arrays_file else {}
+        arrays_config = orjson.loads(arrays_file.read()) if arrays_file else []
 
         array_names = {}
 
@@ -440,53 +507,31 @@ def bifacial_system_view(request):
 
         location_params = {
             "name": simulation_name,
-            "lat": request.POST.get("lat"),
-            "lon": request.POST.get("lon"),
-            "alt": request.POST.get("alt"),
-            "tz": request.POST.get("tz"),
-            "albedo": request.POST.get("albedo"),
+            **{field: post.get(field) for field in SITE_FIELDS},
         }
 
         bifacial_params = {
-            "bifaciality": float(request.POST.get("bifaciality")),
-            "gcr": float(request.POST.get("gcr")),
-            "pvrow_height": float(request.POST.get("pvrow_height")),
-            "pvrow_width": float(request.POST.get("pvrow_width")),
-            "n_pvrows": int(request.POST.get("n_pvrows")),
-            "index_observed_pvrow": int(request.POST.get("index_observed_pvrow")),
-            "rho_front_pvrow": float(request.POST.get("rho_front_pvrow")),
-            "rho_back_pvrow": float(request.POST.get("rho_back_pvrow")),
-            "horizon_band_angle": float(request.POST.get("horizon_band_angle")),
+            "bifaciality": float(post.get("bifaciality")),
+            "gcr": float(post.get("gcr")),
+            "pvrow_height": float(post.get("pvrow_height")),
+            "pvrow_width": float(post.get("pvrow_width")),
+            "n_pvrows": int(post.get("n_pvrows")),
+            "index_observed_pvrow": int(post.get("index_observed_pvrow")),
+            "rho_front_pvrow": float(post.get("rho_front_pvrow")),
+            "rho_back_pvrow": float(post.get("rho_back_pvrow")),
+            "horizon_band_angle": float(post.get("horizon_band_angle")),
         }
 
         system_params = {
             "arrays_config": arrays_config,
             "bifaciality": bifacial_params,
-            "surface_azimuth": request.POST.get("azimuth"),
-            "surface_tilt": request.POST.get("tilt"),
-            "module": request.POST.get("module"),
-            "module_type": request.POST.get("module_type"),
-            "inverter": request.POST.get("inverter"),
-            "modules_per_string": request.POST.get("modules_per_string"),
-            "strings": request.POST.get("strings"),
-            "temp_model": request.POST.get("temp_model"),
-            "temp_model_params": request.POST.get("temp_model_params"),
-            "description": request.POST.get("description"),
-            "year": request.POST.get("year"),
+            "surface_azimuth": post.get("azimuth"),
+            "surface_tilt": post.get("tilt"),
+            **{field: post.get(field) for field in CATALOG_SYSTEM_FIELDS},
+            "description": description,
         }
 
-        losses_params = {
-            "soiling": request.POST.get("soiling"),
-            "shading": request.POST.get("shading"),
-            "snow": request.POST.get("snow"),
-            "mismatch": request.POST.get("mismatch"),
-            "wiring": request.POST.get("wiring"),
-            "connections": request.POST.get("connections"),
-            "lid": request.POST.get("lid"),
-            "nameplate": request.POST.get("nameplate"),
-            "age": request.POST.get("age"),
-            "availability": request.POST.get("availability"),
-        }
+        losses_params = {field: post.get(field) for field in LOSSES_FIELDS}
 
         bpv = bifacial_simulation.BifacialPVSimulator(
             location_params=location_params,
@@ -495,17 +540,16 @@ def bifacial_system_view(request):
         )
 
         result = bpv.run_simulation()
-        result_id = db.save_modelchain_result(
-            result=result,
-            array_names=array_names,
-            simulation_name=simulation_name,
-            description=description,
-        )
+        with DataManager(DatabaseConnection()) as db:
+            result_id = db.save_modelchain_result(
+                result=result,
+                array_names=array_names,
+                simulation_name=simulation_name,
+                description=description,
+            )
 
-        db.close()
         messages.success(request, f"Configured system with {len(arrays_config)} arrays")
-        signer = Signer()
-        token = signer.sign(result_id)
+        token = SIGNER.sign(result_id)
         return redirect("modelchain_result", token=token)
 
     context = {}
@@ -513,10 +557,8 @@ def bifacial_system_view(request):
 
 
 def modelchain_result_view(request, token):
-    signer = Signer()
-
     try:
-        result_id = signer.unsign(token)
+        result_id = SIGNER.unsign(token)
     except Exception:
         return redirect(request.META.get("HTTP_REFERER", "/"))
 
@@ -525,111 +567,162 @@ def modelchain_result_view(request, token):
     version = cache.get(cache_version_key, 1)  # used for invalidation control
 
     # Primary cache keys
-    data_key = f"mc_data_{user_id}_{result_id}_v{version}"
-    norm_key = f"mc_norm_{user_id}_{result_id}_v{version}"
-    charts_key = f"mc_charts_{user_id}_{result_id}_v{version}"
-
-    # Fetch or compute simulation data
-    simulation_data = cache.get(data_key)
-    if not simulation_data:
-        conn = DatabaseConnection()
-        db = DataManager(conn)
-        simulation_data = db.fetch_modelchain_result(result_id)
-        db.close()
-        cache.set(data_key, simulation_data, timeout=86400)  # cache for 24h
-
-    # Pre-normalize data for chart generation
-    normalized_data = cache.get(norm_key)
-    if not normalized_data:
-        normalized_data = {
-            "dc": plots.normalize_pv_tuple(simulation_data["dc"]),
-            "ac": plots.normalize_pv_tuple(simulation_data["ac_aoi"]),
-            "irr": plots.normalize_pv_tuple(simulation_data["irradiance"]),
-            "weather": plots.normalize_pv_tuple(simulation_data["weather"]),
-            "cell_temp": plots.normalize_pv_tuple(simulation_data["cell_temperature"]),
-        }
-        cache.set(norm_key, normalized_data, timeout=86400)
+    data_key = f"mc_data_{MC_CACHE_SCHEMA}_{user_id}_{result_id}_v{version}"
+    norm_key = f"mc_norm_{MC_CACHE_SCHEMA}_{user_id}_{result_id}_v{version}"
+    charts_key = f"mc_charts_{MC_CACHE_SCHEMA}_{user_id}_{result_id}_v{version}"
+    metrics_key = f"mc_metrics_{MC_CACHE_SCHEMA}_{user_id}_{result_id}_v{version}"
+
+    # User-specific visualization parameters
+    ts = TimeseriesParams.from_query(request.GET)
+
+    # Time-series charts are cached per combination of view parameters
+    ts_digest = hashlib.md5(repr(ts).encode()).hexdigest()
+    ts_key = (
+        f"mc_timeseries_{MC_CACHE_SCHEMA}_{user_id}_{result_id}_v{version}_{ts_digest}"
+    )
 
-    # Cache heavy chart objects separately for modular control
-    charts = cache.get(charts_key)
+    # The page only changes with the cache version, the view parameters or the
+    # user's array file, so a matching ETag skips the cache reads and the render
+    arrays_file = "random_simulation_arrays.json"
+    arrays_mtime = array_storage.array_file_mtime(request.user, arrays_file)
+    etag_source = (
+        f"{user_id}:{result_id}:{MC_CACHE_SCHEMA}:{version}:{ts_digest}:{arrays_mtime}"
+    )
+    etag = f'"{hashlib.md5(etag_source.encode()).hexdigest()}"'
+    if etag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", "")):
+        return HttpResponseNotModified(headers={"ETag": etag})
+
+    # One round-trip for everything a fully cached page renders
+    cached = cache.get_many([charts_key, ts_key, metrics_key])
+    charts = cached.get(charts_key)
+    time_series = cached.get(ts_key)
+    metrics = cached.get(metrics_key)
+    pending = {}  # 24h entries, written together with set_many
+
+    # Simulation data is only loaded when something has to be rebuilt
+    if not (charts and time_series and metrics):
+        simulation_data = cache.get(data_key)
+        if not simulation_data:
+            with DataManager(DatabaseConnection()) as db:
+                simulation_data = db.fetch_modelchain_result(
+                    result_id, columns=MODELCHAIN_RESULT_COLUMNS
+                )
+            pending[data_key] = simulation_data
+
+    # Normalized data is only needed to (re)build the charts
     if not charts:
+        normalized_data = cache.get(norm_key)
+        if not normalized_data:
+            normalized_data = plots.PlotData.from_simulation(simulation_data)
+            pending[norm_key] = normalized_data
+
         nd = normalized_data
-        charts = {
-            "temp_wind": plots.temp_wind_chart(nd["weather"]),
-            "temp_vs_irr": plots.temp_vs_irradiance(nd["cell_temp"], nd["irr"]),
-            "dc_vs_ac": plots.dc_vs_ac(nd["dc"], nd["ac"]),
-            "dc_vs_irr": plots.dc_vs_irradiance(nd["dc"], nd["irr"]),
-            "inverter_eff": plots.inverter_efficiency(nd["dc"], nd["ac"]),
-            "power_ts": plots.power_timeseries(nd["dc"], nd["ac"]),
-            "monthly_yield": plots.monthly_yield(nd["ac"]),
-            "temp_derate": plots.temp_derating(nd["cell_temp"], nd["dc"]),
-            "power_heatmap": plots.power_heatmap(nd["ac"]),
-            "daily_yield": plots.daily_yield(nd["ac"]),
-            "cap_factor": plots.capacity_factor(nd["ac"]),
-            "cum_energy": plots.cumulative_energy(nd["ac"]),
-            "solar_elevation": plots.solar_elevation_chart(
-                simulation_data["solar_position"]
-            ),
-            "sunpath": plots.sunpath_chart(simulation_data["solar_position"]),
-            "poa_vs_ghi": plots.poa_vs_ghi_chart(nd["irr"], nd["weather"]),
-            "poa_heatmap": plots.poa_heatmap(nd["irr"]),
-            "irr_breakdown": plots.irradiance_breakdown_chart(nd["weather"]),
-            "peak_power_vs_irr": plots.peak_power_vs_irradiance(nd["ac"], nd["irr"]),
-            "performance_ratio": plots.performance_ratio(nd["ac"], nd["irr"]),
+        solar_position = simulation_data["solar_position"]
+
+        # Warm the shared aggregates first so concurrent charts don't race on them
+        _parallel_map({name: (getattr, nd, name) for name in nd.AGGREGATES})
+
+        charts = utils.chart_bundle(
+            _parallel_map(
+                {
+                    "temp_wind": (plots.temp_wind_chart, nd.weekly_weather),
+                    "temp_vs_irr": (plots.temp_vs_irradiance, nd.cell_temp, nd.irr),
+                    "dc_vs_ac": (plots.dc_vs_ac, nd.dc, nd.ac),
+                    "dc_vs_irr": (plots.dc_vs_irradiance, nd.dc, nd.irr),
+                    "inverter_eff": (plots.inverter_efficiency, nd.dc, nd.ac),
+                    "power_ts": (plots.power_timeseries, nd.weekly_dc, nd.weekly_ac),
+                    "monthly_yield": (plots.monthly_yield, nd.monthly_ac_kwh),
+                    "temp_derate": (plots.temp_derating, nd.cell_temp, nd.dc),
+                    "power_heatmap": (plots.power_heatmap, nd.ac_day_hour),
+                    "daily_yield": (plots.daily_yield, nd.daily_ac),
+                    "cap_factor": (plots.capacity_factor, nd.monthly_ac_kwh),
+                    "cum_energy": (plots.cumulative_energy, nd.ac),
+                    "solar_elevation": (plots.solar_elevation_chart, solar_position),
+                    "sunpath": (plots.sunpath_chart, solar_position),
+                    "poa_vs_ghi": (plots.poa_vs_ghi_chart, nd.irr, nd.weather),
+                    "poa_heatmap": (plots.poa_heatmap, nd.poa_day_hour),
+                    "irr_breakdown": (
+                        plots.irradiance_breakdown_chart,
+                        nd.weekly_weather,
+                    ),
+                    "peak_power_vs_irr": (
+                        plots.peak_power_vs_irradiance,
+                        nd.daily_ac,
+                        nd.daily_poa_mean,
+                    ),
+                    "performance_ratio": (
+                        plots.performance_ratio,
+                        nd.weekly_ac,
+                        nd.weekly_irr,
+                    ),
+                }
+            )
+        )
+        pending[charts_key] = charts
+
+    # Analysis modules are independent of each other, so run them concurrently
+    if not metrics:
+        metrics = _parallel_map(
+            {
+                "general": (
+                    lambda: general_analyzer.Analyzer(
+                        simulation_data
+                    ).calculate_score(),
+                ),
+                "seasonal": (
+                    lambda: seasonal_analyzer.SeasonalAnalyzer(
+                        simulation_data
+                    ).generate_seasonal_report(),
+                ),
+                "financial": (
+                    lambda: financial_analysis.FinancialAnalyzer(
+                        simulation_data
+                    ).calculate_score(),
+                ),
+            }
+        )
+        metrics["meta"] = {
+            "simulation_name": simulation_data["simulation_name"],
+            "description": simulation_data["description"],
+            "created_at": simulation_data["created_at"],
         }
-        cache.set(charts_key, charts, timeout=86400)
-
-    # User-specific visualization parameters
-    ac_aoi_param = request.GET.get("ac_aoi_param", "ac")
-    ac_aoi_array = int(request.GET.get("ac_aoi_array", 0))
-    cell_temp_array = int(request.GET.get("cell_temp_array", 0))
-    dc_output_param = request.GET.get("dc_output_param", "i_sc")
-    dc_output_array = int(request.GET.get("dc_output_array", 0))
-    diode_params_param = request.GET.get("diode_params_param", "i_l").lower()
-    diode_params_array = int(request.GET.get("diode_params_array", 0))
-    irradiance_param = request.GET.get("irradiance_param", "poa_global")
-    irradiance_array = int(request.GET.get("irradiance_array", 0))
-    weather_param = request.GET.get("weather_param", "temp_air")
-
-    # Build time-series charts (not cached — lightweight & parameterized)
-    time_series = {
-        "ac_aoi": timeseries.ac_aoi_chart(
-            simulation_data["ac_aoi"], ac_aoi_array, ac_aoi_param
-        ),
-        "cell_temp": timeseries.cell_temp_chart(
-            simulation_data["cell_temperature"], cell_temp_array
-        ),
-        "dc_output": timeseries.dc_output_chart(
-            simulation_data["dc"], dc_output_array, dc_output_param
-        ),
-        "diode_params": timeseries.diode_params_chart(
-            simulation_data["diode_params"], diode_params_array, diode_params_param
-        ),
-        "irradiance": timeseries.total_irradiance_chart(
-            simulation_data["irradiance"], irradiance_array, irradiance_param
-        ),
-        "weather": timeseries.weather_chart(simulation_data["weather"], weather_param),
-    }
+        pending[metrics_key] = metrics
 
-    meta_data = {
-        "simulation_name": simulation_data["simulation_name"],
-        "description": simulation_data["description"],
-        "created_at": simulation_data["created_at"],
-    }
+    if pending:
+        cache.set_many(pending, timeout=86400)
 
-    # Analysis modules (can also be cached individually if expensive)
-    gm = general_analyzer.Analyzer(simulation_data)
-    sa = seasonal_analyzer.SeasonalAnalyzer(simulation_data)
-    fn = financial_analysis.FinancialAnalyzer(simulation_data)
-    general_metrics = gm.calculate_score()
-    seasonal_analysis = sa.generate_seasonal_report()
-    financial_metrics = fn.calculate_score()
+    if not time_series:
+        time_series = {
+            "ac_aoi": timeseries.ac_aoi_chart(
+                simulation_data["ac_aoi"], ts.ac_aoi_array, ts.ac_aoi_param
+            ),
+            "cell_temp": timeseries.cell_temp_chart(
+                simulation_data["cell_temperature"], ts.cell_temp_array
+            ),
+            "dc_output": timeseries.dc_output_chart(
+                simulation_data["dc"], ts.dc_output_array, ts.dc_output_param
+            ),
+            "diode_params": timeseries.diode_params_chart(
+                simulation_data["diode_params"],
+                ts.diode_params_array,
+                ts.diode_params_param,
+            ),
+            "irradiance": timeseries.total_irradiance_chart(
+                simulation_data["irradiance"],
+                ts.irradiance_array,
+                ts.irradiance_param,
+            ),
+            "weather": timeseries.weather_chart(
+                simulation_data["weather"], ts.weather_param
+            ),
+        }
+        cache.set(ts_key, time_series, timeout=3600)
 
     context = {
-        "meta_data": meta_data,
-        "general_metrics": general_metrics,
-        "seasonal_analysis": seasonal_analysis,
-        "financial_data": financial_metrics,
+        "meta_data": metrics["meta"],
+        "general_metrics": metrics["general"],
+        "seasonal_analysis": metrics["seasonal"],
+        "financial_data": metrics["financial"],
         "charts": charts,
         "timeseries": time_series,
         "ac_aoi_cols": ["ac", "aoi", "aoi_modifier"],
@@ -652,20 +745,22 @@ def modelchain_result_view(request, token):
             "apparent_elevation",
             "equation_of_time",
         ],
-        "arrays": array_storage.load_array_file(
-            request.user, "random_simulation_arrays.json"
-        ),
+        "arrays": array_storage.load_array_file(request.user, arrays_file),
     }
 
-    return render(request, "analytics/modelchain_result.html", context)
+    response = render(request, "analytics/modelchain_result.html", context)
+    response["ETag"] = etag
+    # Browsers must revalidate, but may keep the page for a 304
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
 
 
 def weather_view(request):
-    conn = DatabaseConnection()
-    db = DataManager(conn)
     lat, lon = -1.2921, 36.8219
-    location_data, current_df, hourly_df, daily_df = db.fetch_openmeteo_data(lat, lon)
-    db.close()
+    with DataManager(DatabaseConnection()) as db:
+        location_data, current_df, hourly_df, daily_df = db.fetch_openmeteo_data(
+            lat, lon
+        )
     wa = weather_analyzer.WeatherAnalyzer(
         location_data=location_data,
         current_weather=current_df,
@@ -677,27 +772,31 @@ def weather_view(request):
     return render(request, "analytics/weather.html", context)
 
 
+@cache_page(60 * 15)
+@vary_on_cookie
 def climate_modelling_view(request):
     context = {}
     return render(request, "analytics/climate_modelling.html", context)
 
 
+@cache_page(60 * 15)
+@vary_on_cookie
 def help_view(request):
     context = {}
     return render(request, "analytics/help.html", context)
 
 
+@cache_page(60 * 15)
+@vary_on_cookie
 def repository_view(request):
     context = {}
     return render(request, "analytics/repository.html", context)
 
 
 def air_quality_view(request):
-    conn = DatabaseConnection()
-    db = DataManager(conn)
     lat, lon = -1.2921, 36.8219
-    location_data, current_df, hourly_df = db.fetch_air_quality_data(lat, lon)
-    db.close()
+    with DataManager(DatabaseConnection()) as db:
+        location_data, current_df, hourly_df = db.fetch_air_quality_data(lat, lon)
     aq = airquality_analyzer.AirQualityAnalyzer(
         location_data=location_data,
         current_weather=current_df,
@@ -708,27 +807,46 @@ def air_quality_view(request):
     return render(request, "analytics/air_quality.html", context)
 
 
+@cache_page(60 * 15)
 def module_search(request):
-    query = request.GET.get("q", "").lower()
-    modules = utils.load_CEC_modules()
-    results = [
-        {"name": name, "manufacturer": mfg}
-        for name, mfg in modules.items()
-        if query in name.lower()
-    ][
-        :50
-    ]  # limit to 50 results
-    return JsonResponse(results, safe=False)
+    query = request.GET.get("q", "").strip().lower()
+    if len(query) < MIN_SEARCH_QUERY:
+        return HttpResponse(b"[]", content_type="application/json")
 
+    results = utils.search_catalog(utils.CEC_module_index(), query)
+    return HttpResponse(orjson.dumps(results), content_type="application/json")
 
+
+@cache_page(60 * 15)
 def inverter_search(request):
-    query = request.GET.get("q", "").lower()
-    modules = utils.load_CEC_inverters()
-    results = [
-        {"name": name, "manufacturer": mfg}
-        for name, mfg in modules.items()
-        if query in name.lower()
-    ][
-        :50
-    ]  # limit to 50 results
-    return JsonResponse(results, safe=False)
+    query = request.GET.get("q", "").strip().lower()
+    if len(query) < MIN_SEARCH_QUERY:
+        return HttpResponse(b"[]", content_type="application/json")
+
+    results = utils.search_catalog(utils.CEC_inverter_index(), query)
+    return HttpResponse(orjson.dumps(results), content_type="application/json")
+
+
+# Weekly OHLC buckets change at most daily
+@cache_page(60 * 60)
+def irradiance_ohlc(request):
+    bucket = OHLC_BUCKETS.get(request.GET.get("bucket", "1w"), "1 week")
+    try:
+        max_points = int(request.GET.get("n", MAX_OHLC_POINTS))
+    except ValueError:
+        max_points = MAX_OHLC_POINTS
+    max_points = max(1, min(max_points, MAX_OHLC_POINTS))
+
+    with DataManager(DatabaseConnection()) as dbm:
+        df = dbm.get_irradiance_ohlc_data(bucket=bucket, max_points=max_points)
+
+    if df.empty:
+        return HttpResponse(b"{}", content_type="application/json")
+
+    # time_bucket over a DATE column yields datetime.date objects
+    buckets = pd.to_datetime(df["bucket"])
+    data = {"bucket": buckets.dt.strftime("%Y-%m-%d").tolist()}
+    for column in ("open", "high", "low", "close"):
+        data[column] = df[column].astype(float).tolist()
+
+    return HttpResponse(orjson.dumps(data), content_type="application/json")
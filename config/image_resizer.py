@@ -1,15 +1,47 @@
 #!/usr/bin/env python3
 import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from PIL import Image
 
 
+def _compress_image(paths, max_width, max_height, quality):
+    input_path, output_path = paths
+    filename = os.path.basename(input_path)
+
+    try:
+        img = Image.open(input_path)
+        is_jpeg = img.format == "JPEG"
+
+        if max_width or max_height:
+            size = (max_width or img.width, max_height or img.height)
+            # JPEGs decode straight to a reduced DCT scale instead of full size
+            img.draft("RGB", size)
+
+        if img.mode in ("RGBA", "P"):
+            img = img.convert("RGB")
+
+        if max_width or max_height:
+            img.thumbnail(size)
+
+        if is_jpeg:
+            img.save(output_path, optimize=True, quality=quality, progressive=True)
+        else:
+            img.save(output_path, optimize=True, quality=quality)
+        print(f"{filename} compressed -> {output_path}")
+    except Exception as e:
+        print(f"Skipping {filename}: {e}")
+
+
 def compress_and_resize_images(
     input_dir, output_dir, max_width=1920, max_height=1080, quality=85
 ):
     os.makedirs(output_dir, exist_ok=True)
     supported_ext = (".jpg", ".jpeg", ".png", ".webp")
 
+    # Output directories are created up front so the workers never race on them
+    pairs = []
     for root, _, files in os.walk(input_dir):
         for filename in files:
             if not filename.lower().endswith(supported_ext):
@@ -19,21 +51,14 @@ def compress_and_resize_images(
             rel_path = os.path.relpath(root, input_dir)
             save_dir = os.path.join(output_dir, rel_path)
             os.makedirs(save_dir, exist_ok=True)
-            output_path = os.path.join(save_dir, filename)
-
-            try:
-                img = Image.open(input_path)
-
-                if img.mode in ("RGBA", "P"):
-                    img = img.convert("RGB")
+            pairs.append((input_path, os.path.join(save_dir, filename)))
 
-                if max_width or max_height:
-                    img.thumbnail((max_width or img.width, max_height or img.height))
-
-                img.save(output_path, optimize=True, quality=quality)
-                print(f"{filename} compressed -> {output_path}")
-            except Exception as e:
-                print(f"Skipping {filename}: {e}")
+    # Decoding and encoding are CPU-bound, so each image gets a worker process
+    worker = partial(
+        _compress_image, max_width=max_width, max_height=max_height, quality=quality
+    )
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(worker, pairs, chunksize=8))
 
     print("Done compressing all images.")
 
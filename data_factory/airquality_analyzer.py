@@ -2,6 +2,111 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
+from bisect import bisect_left
+
+# Hourly pollutant columns, kept as float arrays by the analyzer
+HOURLY_POLLUTANTS = (
+    "pm2_5",
+    "pm10",
+    "ozone",
+    "nitrogen_dioxide",
+    "sulphur_dioxide",
+    "carbon_monoxide",
+    "uv_index",
+)
+
+# Classification scales as (inclusive upper bounds, labels); a value above the
+# last bound takes the last label
+US_CATEGORIES = (
+    "GOOD",
+    "MODERATE",
+    "UNHEALTHY_FOR_SENSITIVE_GROUPS",
+    "UNHEALTHY",
+    "VERY_UNHEALTHY",
+    "HAZARDOUS",
+)
+EUROPEAN_AQI_SCALE = (
+    (25, 50, 75, 100),
+    ("VERY_GOOD", "GOOD", "MODERATE", "POOR", "VERY_POOR"),
+)
+US_AQI_SCALE = ((50, 100, 150, 200, 300), US_CATEGORIES)
+AQI_LEVEL_SCALE = ((50, 100, 150, 200, 300), (1, 2, 3, 4, 5, 6))
+PM25_SCALE = ((12, 35.4, 55.4, 150.4, 250.4), US_CATEGORIES)
+PM10_SCALE = ((50, 154, 254, 354, 424), US_CATEGORIES)
+
+# The summary folds the top two particulate levels into HAZARDOUS
+SUMMARY_QUALITY_LABELS = (
+    "GOOD",
+    "MODERATE",
+    "UNHEALTHY_FOR_SENSITIVE_GROUPS",
+    "UNHEALTHY",
+    "HAZARDOUS",
+    "HAZARDOUS",
+)
+
+PM25_HEALTH_SCALE = (
+    (12, 35.4, 55.4, 150.4),
+    (
+        "Low health risk",
+        "Moderate risk - Unusual sensitivity possible",
+        "Increased risk for sensitive groups",
+        "Health alert - Everyone may experience effects",
+        "Health warnings of emergency conditions",
+    ),
+)
+PM10_HEALTH_SCALE = (
+    (50, 154, 254),
+    (
+        "Low health risk",
+        "Moderate risk",
+        "Unhealthy for sensitive groups",
+        "Health alert",
+    ),
+)
+OZONE_HEALTH_SCALE = (
+    (50, 100),
+    ("Good", "Moderate", "Poor - Respiratory irritation possible"),
+)
+NO2_HEALTH_SCALE = ((50, 100), ("Good", "Moderate", "Poor - Respiratory effects"))
+SO2_HEALTH_SCALE = ((50, 100), ("Good", "Moderate", "Poor - Respiratory irritation"))
+CO_HEALTH_SCALE = (
+    (5000, 10000),
+    ("Good", "Moderate", "Poor - Potential health effects"),
+)
+
+
+def _classify(value: Optional[float], scale: tuple, unknown: Any = "UNKNOWN") -> Any:
+    """Label for a single value on a classification scale."""
+    if value is None or pd.isna(value):
+        return unknown
+    bounds, labels = scale
+    return labels[bisect_left(bounds, float(value))]
+
+
+def _classify_array(values, scale: tuple, unknown: Any = "UNKNOWN") -> List[Any]:
+    """Labels for a whole column of values on a classification scale."""
+    bounds, labels = scale
+    values = np.asarray(values, dtype=float)
+    result = np.asarray(labels, dtype=object)[np.searchsorted(bounds, values)]
+    result[np.isnan(values)] = unknown
+    return result.tolist()
+
+
+def _nanmean(values: np.ndarray) -> float:
+    """Mean of the non-NaN values, NaN when there are none (like Series.mean)."""
+    values = values[~np.isnan(values)]
+    return values.mean() if values.size else np.nan
+
+
+def _isoformat_column(times: pd.Series) -> List[Optional[str]]:
+    """Timestamp.isoformat() for a whole column of whole-second timestamps."""
+    times = pd.to_datetime(times)
+    text = times.dt.strftime("%Y-%m-%dT%H:%M:%S")
+    if times.dt.tz is not None:
+        # isoformat writes the UTC offset as +HH:MM
+        offset = times.dt.strftime("%z")
+        text = text + offset.str[:3] + ":" + offset.str[3:]
+    return text.astype(object).where(text.notna(), None).tolist()
 
 
 class AirQualityAnalyzer:
@@ -22,11 +127,36 @@ class AirQualityAnalyzer:
         self.location_data = location_data
         self.current_df = current_weather
         self.hourly_df = hourly_weather
+        self._current = None
 
         # Convert time columns to datetime if they exist
         if not self.hourly_df.empty and "date" in self.hourly_df.columns:
             self.hourly_df["date"] = pd.to_datetime(self.hourly_df["date"])
 
+        # Pollutant columns as float arrays, NaN-filled when a column is missing
+        self._hourly = {
+            column: (
+                self.hourly_df[column].to_numpy(dtype=float)
+                if column in self.hourly_df.columns
+                else np.full(len(self.hourly_df), np.nan)
+            )
+            for column in HOURLY_POLLUTANTS
+        }
+
+        # ISO strings for the 24 forecast hours the breakdown and peak periods report
+        next_24h = self.hourly_df.head(24)
+        self._iso_times = (
+            _isoformat_column(next_24h["time"])
+            if "time" in next_24h.columns
+            else [None] * len(next_24h)
+        )
+
+    def _current_row(self) -> Dict[str, Any]:
+        """The current conditions row as a plain dict, built once per analyzer."""
+        if self._current is None:
+            self._current = self.current_df.iloc[0].to_dict()
+        return self._current
+
     def _round_value(
         self, value: Optional[float], decimals: int = 2
     ) -> Optional[float]:
@@ -87,7 +217,7 @@ class AirQualityAnalyzer:
         if self.current_df.empty:
             return {"error": "No current air quality data available"}
 
-        current = self.current_df.iloc[0]
+        current = self._current_row()
 
         return {
             "aqi_indices": {
@@ -153,15 +283,16 @@ class AirQualityAnalyzer:
         # Next 24 hours analysis
         next_24h = self.hourly_df.head(24)
 
+        # One aggregation pass over both particulate columns
+        stats = next_24h[["pm2_5", "pm10"]].agg(["max", "min", "mean"]).to_dict()
+
         return {
             "time_period": "next_24_hours",
             "pollutant_trends": {
-                "pm2_5": self._analyze_pollutant_trend(next_24h, "pm2_5"),
-                "pm10": self._analyze_pollutant_trend(next_24h, "pm10"),
-                "ozone": self._analyze_pollutant_trend(next_24h, "ozone"),
-                "nitrogen_dioxide": self._analyze_pollutant_trend(
-                    next_24h, "nitrogen_dioxide"
-                ),
+                "pm2_5": self._analyze_pollutant_trend("pm2_5"),
+                "pm10": self._analyze_pollutant_trend("pm10"),
+                "ozone": self._analyze_pollutant_trend("ozone"),
+                "nitrogen_dioxide": self._analyze_pollutant_trend("nitrogen_dioxide"),
             },
             "peak_periods": {
                 "worst_air_quality": self._find_worst_air_quality_period(next_24h),
@@ -169,16 +300,20 @@ class AirQualityAnalyzer:
             },
             "statistical_summary": {
                 "pm2_5": {
-                    "max": self._round_value(next_24h["pm2_5"].max()),
-                    "min": self._round_value(next_24h["pm2_5"].min()),
-                    "avg": self._round_value(next_24h["pm2_5"].mean()),
-                    "above_unhealthy_hours": len(next_24h[next_24h["pm2_5"] > 35.4]),
+                    "max": self._round_value(stats["pm2_5"]["max"]),
+                    "min": self._round_value(stats["pm2_5"]["min"]),
+                    "avg": self._round_value(stats["pm2_5"]["mean"]),
+                    "above_unhealthy_hours": int(
+                        (self._hourly["pm2_5"][:24] > 35.4).sum()
+                    ),
                 },
                 "pm10": {
-                    "max": self._round_value(next_24h["pm10"].max()),
-                    "min": self._round_value(next_24h["pm10"].min()),
-                    "avg": self._round_value(next_24h["pm10"].mean()),
-                    "above_unhealthy_hours": len(next_24h[next_24h["pm10"] > 154]),
+                    "max": self._round_value(stats["pm10"]["max"]),
+                    "min": self._round_value(stats["pm10"]["min"]),
+                    "avg": self._round_value(stats["pm10"]["mean"]),
+                    "above_unhealthy_hours": int(
+                        (self._hourly["pm10"][:24] > 154).sum()
+                    ),
                 },
             },
             "hourly_breakdown": self._get_hourly_breakdown(next_24h),
@@ -189,13 +324,11 @@ class AirQualityAnalyzer:
         if self.current_df.empty or self.hourly_df.empty:
             return {"error": "Insufficient data for AQI analysis"}
 
-        current = self.current_df.iloc[0]
+        current = self._current_row()
         next_24h = self.hourly_df.head(24)
 
         # Calculate estimated AQI from pollutants for hourly data
-        hourly_aqi_estimates = [
-            self._calculate_aqi_from_pollutants(row) for _, row in next_24h.iterrows()
-        ]
+        hourly_aqi_estimates = self._calculate_aqi_series(24)
 
         return {
             "current_aqi": {
@@ -216,7 +349,7 @@ class AirQualityAnalyzer:
         if self.current_df.empty:
             return {"error": "No pollutant data available"}
 
-        current = self.current_df.iloc[0]
+        current = self._current_row()
 
         return {
             "particulate_matter": {
@@ -268,7 +401,7 @@ class AirQualityAnalyzer:
         if self.current_df.empty:
             return {"error": "No data for health recommendations"}
 
-        current = self.current_df.iloc[0]
+        current = self._current_row()
         recommendations = {
             "general_population": [],
             "sensitive_groups": [],
@@ -329,7 +462,7 @@ class AirQualityAnalyzer:
         if self.current_df.empty:
             return alerts
 
-        current = self.current_df.iloc[0]
+        current = self._current_row()
 
         # PM2.5 alerts
         pm25 = current.get("pm2_5", 0)
@@ -386,16 +519,18 @@ class AirQualityAnalyzer:
 
         # Check hourly forecast for upcoming alerts
         if not self.hourly_df.empty:
-            next_12h = self.hourly_df.head(12)
-            high_pm25_hours = next_12h[next_12h["pm2_5"] > 35.4]
-            if not high_pm25_hours.empty:
+            # Only the pm2_5 column is needed, so skip filtering the whole frame
+            pm25 = self._hourly["pm2_5"][:12]
+            high_pm25 = pm25[pm25 > 35.4]
+            if high_pm25.size:
+                peak = self._round_value(high_pm25.max())
                 alerts.append(
                     {
                         "type": "FORECAST_HIGH_PM25",
                         "level": "MODERATE",
                         "pollutant": "PM2.5",
                         "message": "High PM2.5 levels forecast in next 12 hours",
-                        "details": f"Peak PM2.5: {self._round_value(high_pm25_hours["pm2_5"].max())} μg/m³",
+                        "details": f"Peak PM2.5: {peak} μg/m³",
                     }
                 )
 
@@ -413,21 +548,16 @@ class AirQualityAnalyzer:
         if self.current_df.empty:
             return summary
 
-        current = self.current_df.iloc[0]
+        current = self._current_row()
         pm25 = current.get("pm2_5", 0)
         pm10 = current.get("pm10", 0)
 
-        # Determine overall quality
-        if pm25 <= 12 and pm10 <= 50:
-            summary["overall_quality"] = "GOOD"
-        elif pm25 <= 35.4 and pm10 <= 154:
-            summary["overall_quality"] = "MODERATE"
-        elif pm25 <= 55.4 and pm10 <= 254:
-            summary["overall_quality"] = "UNHEALTHY_FOR_SENSITIVE_GROUPS"
-        elif pm25 <= 150.4 and pm10 <= 354:
-            summary["overall_quality"] = "UNHEALTHY"
-        else:
-            summary["overall_quality"] = "HAZARDOUS"
+        # Determine overall quality from the worse of the two particulate levels
+        if not (pd.isna(pm25) or pd.isna(pm10)):
+            level = max(
+                bisect_left(PM25_SCALE[0], pm25), bisect_left(PM10_SCALE[0], pm10)
+            )
+            summary["overall_quality"] = SUMMARY_QUALITY_LABELS[level]
 
         # Determine primary concern
         pollutants = {
@@ -451,7 +581,7 @@ class AirQualityAnalyzer:
 
         # Determine outlook
         if not self.hourly_df.empty:
-            next_6h_avg = self.hourly_df.head(6)["pm2_5"].mean()
+            next_6h_avg = _nanmean(self._hourly["pm2_5"][:6])
             if next_6h_avg > pm25 * 1.2:
                 summary["outlook"] = "DETERIORATING"
             elif next_6h_avg < pm25 * 0.8:
@@ -464,93 +594,25 @@ class AirQualityAnalyzer:
     # Helper methods for categorization and analysis
     def _get_european_aqi_category(self, aqi: Optional[float]) -> str:
         """Convert European AQI to category."""
-        if aqi is None or pd.isna(aqi):
-            return "UNKNOWN"
-        aqi = float(aqi)
-        if aqi <= 25:
-            return "VERY_GOOD"
-        elif aqi <= 50:
-            return "GOOD"
-        elif aqi <= 75:
-            return "MODERATE"
-        elif aqi <= 100:
-            return "POOR"
-        else:
-            return "VERY_POOR"
+        return _classify(aqi, EUROPEAN_AQI_SCALE)
 
     def _get_us_aqi_category(self, aqi: Optional[float]) -> str:
         """Convert US AQI to category."""
-        if aqi is None or pd.isna(aqi):
-            return "UNKNOWN"
-        aqi = float(aqi)
-        if aqi <= 50:
-            return "GOOD"
-        elif aqi <= 100:
-            return "MODERATE"
-        elif aqi <= 150:
-            return "UNHEALTHY_FOR_SENSITIVE_GROUPS"
-        elif aqi <= 200:
-            return "UNHEALTHY"
-        elif aqi <= 300:
-            return "VERY_UNHEALTHY"
-        else:
-            return "HAZARDOUS"
+        return _classify(aqi, US_AQI_SCALE)
 
     def _get_aqi_level(self, aqi: Optional[float]) -> int:
         """Get AQI level (1-6)."""
-        if aqi is None or pd.isna(aqi):
-            return 0
-        aqi = float(aqi)
-        if aqi <= 50:
-            return 1
-        elif aqi <= 100:
-            return 2
-        elif aqi <= 150:
-            return 3
-        elif aqi <= 200:
-            return 4
-        elif aqi <= 300:
-            return 5
-        else:
-            return 6
+        return _classify(aqi, AQI_LEVEL_SCALE, unknown=0)
 
     def _get_pm25_category(self, pm25: Optional[float]) -> str:
         """Categorize PM2.5 levels."""
-        if pm25 is None or pd.isna(pm25):
-            return "UNKNOWN"
-        pm25 = float(pm25)
-        if pm25 <= 12:
-            return "GOOD"
-        elif pm25 <= 35.4:
-            return "MODERATE"
-        elif pm25 <= 55.4:
-            return "UNHEALTHY_FOR_SENSITIVE_GROUPS"
-        elif pm25 <= 150.4:
-            return "UNHEALTHY"
-        elif pm25 <= 250.4:
-            return "VERY_UNHEALTHY"
-        else:
-            return "HAZARDOUS"
+        return _classify(pm25, PM25_SCALE)
 
     def _get_pm10_category(self, pm10: Optional[float]) -> str:
         """Categorize PM10 levels."""
-        if pm10 is None or pd.isna(pm10):
-            return "UNKNOWN"
-        pm10 = float(pm10)
-        if pm10 <= 50:
-            return "GOOD"
-        elif pm10 <= 154:
-            return "MODERATE"
-        elif pm10 <= 254:
-            return "UNHEALTHY_FOR_SENSITIVE_GROUPS"
-        elif pm10 <= 354:
-            return "UNHEALTHY"
-        elif pm10 <= 424:
-            return "VERY_UNHEALTHY"
-        else:
-            return "HAZARDOUS"
+        return _classify(pm10, PM10_SCALE)
 
-    def _get_dominant_pollutant(self, current_data: pd.Series) -> str:
+    def _get_dominant_pollutant(self, current_data: Dict[str, Any]) -> str:
         """Determine the dominant pollutant."""
         pollutants = {
             "PM2.5": current_data.get("pm2_5", 0),
@@ -562,15 +624,14 @@ class AirQualityAnalyzer:
         }
         return max(pollutants, key=pollutants.get)
 
-    def _analyze_pollutant_trend(
-        self, hourly_data: pd.DataFrame, pollutant: str
-    ) -> Dict[str, Any]:
-        """Analyze trend for a specific pollutant."""
-        if len(hourly_data) < 2:
+    def _analyze_pollutant_trend(self, pollutant: str) -> Dict[str, Any]:
+        """Analyze trend for a specific pollutant over the next 12 hours."""
+        values = self._hourly[pollutant]
+        if len(values) < 2:
             return {"trend": "STABLE", "change_percent": 0}
 
-        first_half = hourly_data[pollutant].iloc[:6].mean()
-        second_half = hourly_data[pollutant].iloc[6:12].mean()
+        first_half = _nanmean(values[:6])
+        second_half = _nanmean(values[6:12])
 
         if pd.isna(first_half) or pd.isna(second_half) or first_half == 0:
             return {"trend": "STABLE", "change_percent": 0}
@@ -586,81 +647,88 @@ class AirQualityAnalyzer:
 
         return {"trend": trend, "change_percent": self._round_value(change_percent, 1)}
 
-    def _find_worst_air_quality_period(
-        self, hourly_data: pd.DataFrame
-    ) -> Dict[str, Any]:
-        """Find period with worst air quality in next 24 hours."""
-        if hourly_data.empty:
+    def _extreme_period(self, hourly_data: pd.DataFrame, which: str) -> Dict[str, Any]:
+        """Hour with the highest ("max") or lowest ("min") PM2.5 in the hourly data."""
+        hours = len(hourly_data)
+        pm25 = self._hourly["pm2_5"][:hours]
+        if np.isnan(pm25).all():
             return {"time": "Unknown", "pm2_5": None, "pm10": None}
 
-        worst_idx = hourly_data["pm2_5"].idxmax()
-        worst_row = hourly_data.loc[worst_idx]
+        # Positions index the sibling columns directly, skipping NaN like idxmax
+        pos = np.nanargmax(pm25) if which == "max" else np.nanargmin(pm25)
 
         return {
-            "time": self._format_timestamp(worst_row["time"]),
-            "pm2_5": self._round_value(worst_row["pm2_5"]),
-            "pm10": self._round_value(worst_row["pm10"]),
-            "overall_quality": self._get_pm25_category(worst_row["pm2_5"]),
+            "time": self._iso_times[pos],
+            "pm2_5": self._round_value(pm25[pos]),
+            "pm10": self._round_value(self._hourly["pm10"][pos]),
+            "overall_quality": self._get_pm25_category(pm25[pos]),
         }
 
+    def _find_worst_air_quality_period(
+        self, hourly_data: pd.DataFrame
+    ) -> Dict[str, Any]:
+        """Find period with worst air quality in next 24 hours."""
+        return self._extreme_period(hourly_data, "max")
+
     def _find_best_air_quality_period(
         self, hourly_data: pd.DataFrame
     ) -> Dict[str, Any]:
         """Find period with best air quality in next 24 hours."""
-        if hourly_data.empty:
-            return {"time": "Unknown", "pm2_5": None, "pm10": None}
-
-        best_idx = hourly_data["pm2_5"].idxmin()
-        best_row = hourly_data.loc[best_idx]
-
-        return {
-            "time": self._format_timestamp(best_row["time"]),
-            "pm2_5": self._round_value(best_row["pm2_5"]),
-            "pm10": self._round_value(best_row["pm10"]),
-            "overall_quality": self._get_pm25_category(best_row["pm2_5"]),
-        }
+        return self._extreme_period(hourly_data, "min")
 
     def _get_hourly_breakdown(self, hourly_data: pd.DataFrame) -> List[Dict]:
         """Create detailed hourly breakdown."""
+        hours = len(hourly_data)
+        values = [
+            self._iso_times,
+            *(self._hourly[column][:hours].tolist() for column in HOURLY_POLLUTANTS),
+        ]
+        values.append(_classify_array(values[1], PM25_SCALE))
+        values.append(_classify_array(values[2], PM10_SCALE))
+
+        # Walk the columns together rather than materializing a Series per row
         return [
             {
-                "time": self._format_timestamp(row["time"]),
+                "time": time,
                 "pm2_5": {
-                    "value": self._round_value(row.get("pm2_5")),
-                    "category": self._get_pm25_category(row.get("pm2_5")),
+                    "value": self._round_value(pm25),
+                    "category": pm25_cat,
                 },
                 "pm10": {
-                    "value": self._round_value(row.get("pm10")),
-                    "category": self._get_pm10_category(row.get("pm10")),
+                    "value": self._round_value(pm10),
+                    "category": pm10_cat,
                 },
-                "ozone": self._round_value(row.get("ozone")),
-                "nitrogen_dioxide": self._round_value(row.get("nitrogen_dioxide")),
-                "sulphur_dioxide": self._round_value(row.get("sulphur_dioxide")),
-                "carbon_monoxide": self._round_value(row.get("carbon_monoxide")),
-                "uv_index": self._round_value(row.get("uv_index"), 1),
-                "overall_quality": self._get_pm25_category(row.get("pm2_5")),
+                "ozone": self._round_value(ozone),
+                "nitrogen_dioxide": self._round_value(no2),
+                "sulphur_dioxide": self._round_value(so2),
+                "carbon_monoxide": self._round_value(co),
+                "uv_index": self._round_value(uv, 1),
+                "overall_quality": pm25_cat,
             }
-            for _, row in hourly_data.iterrows()
+            for time, pm25, pm10, ozone, no2, so2, co, uv, pm25_cat, pm10_cat in zip(
+                *values
+            )
         ]
 
-    def _calculate_aqi_from_pollutants(self, row: pd.Series) -> float:
-        """Calculate estimated AQI from pollutant concentrations."""
-        # Simple weighted average based on major pollutants
-        pm25 = row.get("pm2_5", 0) or 0
-        pm10 = row.get("pm10", 0) or 0
-        ozone = row.get("ozone", 0) or 0
+    def _calculate_aqi_series(self, hours: int) -> np.ndarray:
+        """Calculate estimated AQI from pollutant concentrations for the next hours."""
+        # Simple weighted average based on major pollutants; missing values count as 0
+        pm25, pm10, ozone = (
+            np.nan_to_num(self._hourly[column][:hours])
+            for column in ("pm2_5", "pm10", "ozone")
+        )
 
         # Normalize and weight (simplified calculation)
         aqi_estimate = (pm25 * 0.4 + pm10 * 0.3 + ozone * 0.3) * 2
-        return max(0, min(500, aqi_estimate))
+        return np.clip(aqi_estimate, 0, 500)
 
-    def _analyze_aqi_trend(self, hourly_aqi: List[float]) -> str:
+    def _analyze_aqi_trend(self, hourly_aqi: np.ndarray) -> str:
         """Analyze AQI trend direction."""
         if len(hourly_aqi) < 6:
             return "STABLE"
 
-        first_quarter = np.mean(hourly_aqi[:6])
-        last_quarter = np.mean(hourly_aqi[-6:])
+        first_quarter = hourly_aqi[:6].mean()
+        last_quarter = hourly_aqi[-6:].mean()
 
         if last_quarter > first_quarter * 1.1:
             return "DETERIORATING"
@@ -679,7 +747,7 @@ class AirQualityAnalyzer:
         """Find when air quality is expected to improve."""
         return self._find_best_air_quality_period(hourly_data)
 
-    def _get_overall_aqi_category(self, current_data: pd.Series) -> str:
+    def _get_overall_aqi_category(self, current_data: Dict[str, Any]) -> str:
         """Get overall AQI category based on multiple pollutants."""
         pm25_cat = self._get_pm25_category(current_data.get("pm2_5"))
         pm10_cat = self._get_pm10_category(current_data.get("pm10"))
@@ -703,7 +771,7 @@ class AirQualityAnalyzer:
         if self.current_df.empty:
             return {"error": "No data for standards comparison"}
 
-        current = self.current_df.iloc[0]
+        current = self._current_row()
 
         return {
             "who_guidelines": {
@@ -731,83 +799,29 @@ class AirQualityAnalyzer:
 
     # Health impact assessment methods
     def _get_pm25_health_impact(self, pm25: Optional[float]) -> str:
-        if pm25 is None or pd.isna(pm25):
-            return "Unknown"
-        pm25 = float(pm25)
-        if pm25 <= 12:
-            return "Low health risk"
-        elif pm25 <= 35.4:
-            return "Moderate risk - Unusual sensitivity possible"
-        elif pm25 <= 55.4:
-            return "Increased risk for sensitive groups"
-        elif pm25 <= 150.4:
-            return "Health alert - Everyone may experience effects"
-        else:
-            return "Health warnings of emergency conditions"
+        return _classify(pm25, PM25_HEALTH_SCALE, unknown="Unknown")
 
     def _get_pm10_health_impact(self, pm10: Optional[float]) -> str:
-        if pm10 is None or pd.isna(pm10):
-            return "Unknown"
-        pm10 = float(pm10)
-        if pm10 <= 50:
-            return "Low health risk"
-        elif pm10 <= 154:
-            return "Moderate risk"
-        elif pm10 <= 254:
-            return "Unhealthy for sensitive groups"
-        else:
-            return "Health alert"
+        return _classify(pm10, PM10_HEALTH_SCALE, unknown="Unknown")
 
     def _get_ozone_health_impact(self, ozone: Optional[float]) -> str:
-        if ozone is None or pd.isna(ozone):
-            return "Unknown"
-        ozone = float(ozone)
-        if ozone <= 50:
-            return "Good"
-        elif ozone <= 100:
-            return "Moderate"
-        else:
-            return "Poor - Respiratory irritation possible"
+        return _classify(ozone, OZONE_HEALTH_SCALE, unknown="Unknown")
 
     def _get_no2_health_impact(self, no2: Optional[float]) -> str:
-        if no2 is None or pd.isna(no2):
-            return "Unknown"
-        no2 = float(no2)
-        if no2 <= 50:
-            return "Good"
-        elif no2 <= 100:
-            return "Moderate"
-        else:
-            return "Poor - Respiratory effects"
+        return _classify(no2, NO2_HEALTH_SCALE, unknown="Unknown")
 
     def _get_so2_health_impact(self, so2: Optional[float]) -> str:
-        if so2 is None or pd.isna(so2):
-            return "Unknown"
-        so2 = float(so2)
-        if so2 <= 50:
-            return "Good"
-        elif so2 <= 100:
-            return "Moderate"
-        else:
-            return "Poor - Respiratory irritation"
+        return _classify(so2, SO2_HEALTH_SCALE, unknown="Unknown")
 
     def _get_co_health_impact(self, co: Optional[float]) -> str:
-        if co is None or pd.isna(co):
-            return "Unknown"
-        co = float(co)
-        if co <= 5000:
-            return "Good"
-        elif co <= 10000:
-            return "Moderate"
-        else:
-            return "Poor - Potential health effects"
+        return _classify(co, CO_HEALTH_SCALE, unknown="Unknown")
 
     def _check_data_freshness(self) -> Dict[str, Any]:
         """Check how fresh the air quality data is."""
         freshness = {"current_data_age": "UNKNOWN", "forecast_currentness": "UNKNOWN"}
 
         if not self.current_df.empty and "observation_time" in self.current_df.columns:
-            obs_time = pd.to_datetime(self.current_df.iloc[0]["observation_time"])
+            obs_time = pd.to_datetime(self._current_row()["observation_time"])
             age_hours = (datetime.now(timezone.utc) - obs_time).total_seconds() / 3600
             freshness["current_data_age"] = f"{self._round_value(age_hours, 1)} hours"
 
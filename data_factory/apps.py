@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class DataFactoryConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "data_factory"
+
+    def ready(self):
+        import plotly.io as pio
+
+        # Encode figure JSON with orjson (numpy arrays are serialized natively)
+        # rather than leaving it to plotly's "auto" engine lookup
+        pio.json.config.default_engine = "orjson"
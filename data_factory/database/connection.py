@@ -1,28 +1,76 @@
 import logging
+import threading
 import psycopg2
+from psycopg2 import pool
 from decouple import config
+from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+_pool = None
+_pool_slots = None
+_pool_lock = threading.Lock()
+
+
+def _connect_params():
+    return {
+        "dbname": config("DB_NAME"),
+        "user": config("DB_USER"),
+        "password": config("DB_PASS"),
+        "host": config("DB_HOST", default="localhost"),
+        "port": config("DB_PORT", default=5432),
+    }
+
+
+def get_pool():
+    """Process-wide connection pool, created on first use."""
+    global _pool, _pool_slots
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # The pool raises PoolError once maxconn connections are out,
+                # so checkouts queue on a semaphore of the same size instead
+                _pool_slots = threading.BoundedSemaphore(settings.DB_POOL_MAX)
+                _pool = pool.ThreadedConnectionPool(
+                    minconn=settings.DB_POOL_MIN,
+                    maxconn=settings.DB_POOL_MAX,
+                    **_connect_params(),
+                )
+                logger.info("DatabaseConnection: Created connection pool")
+
+    return _pool
+
 
 class DatabaseConnection:
     def __init__(self):
-        dbname = config("DB_NAME")
-        user = config("DB_USER")
-        password = config("DB_PASS")
-        host = config("DB_HOST", default="localhost")
-        port = config("DB_PORT", default=5432)
+        self.conn = None
+        self.pooled = False
 
         try:
-            self.conn = psycopg2.connect(
-                dbname=dbname, user=user, password=password, host=host, port=port
-            )
-            logger.warning("DatabaseConnection: Connected to database")
+            db_pool = get_pool()
+
+            if _pool_slots.acquire(timeout=settings.DB_POOL_WAIT):
+                try:
+                    self.conn = db_pool.getconn()
+                except Exception:
+                    _pool_slots.release()
+                    raise
+                self.pooled = True
+            else:
+                logger.warning("DatabaseConnection: Pool busy, connecting directly")
+                self.conn = psycopg2.connect(**_connect_params())
 
         except Exception as e:
             logger.error(f"Database connection failed: {e}")
             raise
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def cursor(self):
         return self.conn.cursor()
 
@@ -34,5 +82,23 @@ class DatabaseConnection:
 
     def close(self):
         if self.conn:
-            self.conn.close()
-            logger.info("DatabaseConnection: Closed connection")
+            conn, self.conn = self.conn, None
+
+            if not self.pooled:
+                conn.close()
+                return
+
+            broken = conn.closed != 0
+
+            # Uncommitted work is discarded, as closing the connection used to do
+            if not broken:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    broken = True
+
+            try:
+                get_pool().putconn(conn, close=broken)
+            finally:
+                _pool_slots.release()
+            logger.info("DatabaseConnection: Returned connection to pool")
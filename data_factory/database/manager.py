@@ -1,7 +1,9 @@
+import io
 import time
 import logging
 import json
 from datetime import datetime, timedelta
+from functools import lru_cache
 import sqlalchemy
 import psycopg2
 
@@ -13,12 +15,39 @@ from data_factory.database import queries
 
 logger = logging.getLogger(__name__)
 
+# fetch_modelchain_result key -> time-series table
+MODELCHAIN_TABLES = {
+    "ac_aoi": "ac_aoi",
+    "airmass": "airmass",
+    "cell_temperature": "cell_temperature",
+    "dc": "dc_output",
+    "diode_params": "diode_params",
+    "irradiance": "total_irradiance",
+    "solar_position": "solar_position",
+    "weather": "weather",
+}
+
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """Shared SQLAlchemy engine; its pool keeps connections across calls."""
+    return sqlalchemy.create_engine(
+        f'postgresql+psycopg2://{config("DB_USER")}:{config("DB_PASS")}@'
+        f'{config("DB_HOST")}:{config("DB_PORT")}/{config("DB_NAME")}'
+    )
+
 
 class DataManager:
     def __init__(self, db: DatabaseConnection):
         self.db = db
         self.page_size = 500
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def insert_irradiance_data(self, df):
         if df is None or df.empty:
             return
@@ -51,9 +80,9 @@ class DataManager:
             logger.error(f"Irradiance data not saved: {e}")
             self.db.rollback()
 
-    def get_irradiance_ohlc_data(self, bucket: str = "1 week"):
+    def get_irradiance_ohlc_data(self, max_points: int, bucket: str = "1 week"):
         try:
-            query = queries.irradiance_ohlc_query(bucket)
+            query = queries.irradiance_ohlc_query(max_points, bucket)
 
             with self.db.cursor() as cur:
                 cur.execute(query)
@@ -108,27 +137,17 @@ class DataManager:
                     d["utc_time"] = pd.to_datetime(d.index)
                     d["array_name"] = array_names.get(str(idx))
 
-                    # Convert all columns to native types
-                    for col in d.columns:
-                        if pd.api.types.is_numeric_dtype(
-                            d[col]
-                        ) or pd.api.types.is_bool_dtype(d[col]):
-                            d[col] = d[col].apply(
-                                lambda x: (
-                                    None
-                                    if pd.isna(x)
-                                    else x.item() if hasattr(x, "item") else x
-                                )
-                            )
-                        else:
-                            d[col] = d[col].apply(lambda x: None if pd.isna(x) else x)
-
                     cols = ["result_id", "utc_time", "array_name"] + [
                         c
                         for c in d.columns
                         if c not in ("result_id", "utc_time", "array_name")
                     ]
-                    records = [tuple(row) for row in d[cols].to_numpy()]
+
+                    # Native Python scalars with None for missing values, converted
+                    # per column rather than per cell
+                    values = d[cols].astype(object)
+                    values = values.where(values.notna(), None)
+                    records = list(values.itertuples(index=False, name=None))
                     query = f"""
                         INSERT INTO {table_name} ({', '.join(cols)})
                         VALUES %s
@@ -231,7 +250,11 @@ class DataManager:
         self.db.commit()
         return result_id
 
-    def fetch_modelchain_result(self, result_id):
+    def fetch_modelchain_result(self, result_id, columns=None):
+        """
+        columns optionally maps result keys to the value columns to read.
+        Keys left out of the mapping are not fetched at all.
+        """
         result = {}
         with self.db.cursor() as cur:
             # Fetch metadata
@@ -260,33 +283,41 @@ class DataManager:
             )
 
             # Helper to fetch time-series and reassemble as tuple
-            def fetch_timeseries(table_name):
-                engine = sqlalchemy.create_engine(
-                    f'postgresql+psycopg2://{config("DB_USER")}:{config("DB_PASS")}@{config("DB_HOST")}:{config("DB_PORT")}/{config("DB_NAME")}'
+            def fetch_timeseries(table_name, table_columns=None):
+                select = (
+                    ", ".join(["utc_time", "array_name", *table_columns])
+                    if table_columns
+                    else "*"
                 )
-                df = pd.read_sql(
-                    f"SELECT * FROM {table_name} WHERE result_id=%s ORDER BY utc_time, array_name",
-                    engine,
-                    params=(result_id,),
+                query = cur.mogrify(
+                    f"SELECT {select} FROM {table_name} WHERE result_id=%s ORDER BY utc_time, array_name",
+                    (result_id,),
+                ).decode()
+
+                # COPY streams the rows as CSV into pandas' C parser instead of
+                # boxing every value into a per-row Python tuple
+                buffer = io.StringIO()
+                cur.copy_expert(
+                    f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)", buffer
                 )
+                buffer.seek(0)
+                df = pd.read_csv(buffer, true_values=["t"], false_values=["f"])
                 if df.empty:
                     return None
+                df["utc_time"] = pd.to_datetime(df["utc_time"], utc=True)
                 df.set_index("utc_time", inplace=True)
                 array_groups = [
-                    g.drop(columns=["result_id", "array_name"])
+                    g.drop(columns=["result_id", "array_name"], errors="ignore")
                     for _, g in df.groupby("array_name")
                 ]
                 return tuple(array_groups) if len(array_groups) > 1 else array_groups[0]
 
             # Fetch all fields
-            result["ac_aoi"] = fetch_timeseries("ac_aoi")
-            result["airmass"] = fetch_timeseries("airmass")
-            result["cell_temperature"] = fetch_timeseries("cell_temperature")
-            result["dc"] = fetch_timeseries("dc_output")
-            result["diode_params"] = fetch_timeseries("diode_params")
-            result["irradiance"] = fetch_timeseries("total_irradiance")
-            result["solar_position"] = fetch_timeseries("solar_position")
-            result["weather"] = fetch_timeseries("weather")
+            for key, table_name in MODELCHAIN_TABLES.items():
+                if columns is None:
+                    result[key] = fetch_timeseries(table_name)
+                elif key in columns:
+                    result[key] = fetch_timeseries(table_name, columns[key])
 
         return result
 
@@ -440,11 +471,7 @@ class DataManager:
         Retrieve and reconstruct current, hourly, and daily weather data
         using SQLAlchemy and location coordinates.
         """
-        engine = sqlalchemy.create_engine(
-            f'postgresql+psycopg2://{config("DB_USER")}:{config("DB_PASS")}@{config("DB_HOST")}:{config("DB_PORT")}/{config("DB_NAME")}'
-        )
-
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             # Step 1: Get location_id for the given coordinates
             location_query = sqlalchemy.sql.text(
                 """
@@ -584,12 +611,7 @@ class DataManager:
         """
         Retrieve and reconstruct air quality data using SQLAlchemy.
         """
-        engine = sqlalchemy.create_engine(
-            f'postgresql+psycopg2://{config("DB_USER")}:{config("DB_PASS")}@'
-            f'{config("DB_HOST")}:{config("DB_PORT")}/{config("DB_NAME")}'
-        )
-
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             # --- Get location ID ---
             location_query = sqlalchemy.sql.text(
                 """
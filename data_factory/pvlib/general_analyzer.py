@@ -1,8 +1,41 @@
 from typing import Dict
+from numba import njit
+import numpy as np
 import pandas as pd
 from data_factory.pvlib import utils
 
 
+DAYLIGHT_THRESHOLD = 10  # W/m² plane-of-array irradiance
+TEMP_COEFF = -0.004  # -0.4% per °C above 25°C
+
+
+@njit("UniTuple(f8, 4)(f8[:], f8[:], f8[:])", cache=True)
+def _daylight_kernel(ac, poa, cell_temp):
+    """
+    Single pass over the hourly samples, returning the daylight sums of
+    actual AC and theoretical DC power, the daylight hour count and the
+    number of those hours that produced power. NaNs are skipped, as in
+    the pandas sums this replaces.
+    """
+    actual_ac = 0.0
+    theoretical_dc = 0.0
+    daylight_hours = 0.0
+    producing_hours = 0.0
+
+    for i in range(ac.shape[0]):
+        if poa[i] > DAYLIGHT_THRESHOLD:
+            daylight_hours += 1
+            if ac[i] > 0:
+                producing_hours += 1
+            if not np.isnan(ac[i]):
+                actual_ac += ac[i]
+            theoretical = poa[i] * (1 + TEMP_COEFF * (cell_temp[i] - 25))
+            if not np.isnan(theoretical):
+                theoretical_dc += theoretical
+
+    return actual_ac, theoretical_dc, daylight_hours, producing_hours
+
+
 class Analyzer:
     def __init__(self, simulation_data: Dict):
         self.ac_power = utils.aggregate_timeseries(
@@ -14,6 +47,7 @@ class Analyzer:
         self.cell_temp = utils.aggregate_timeseries(
             simulation_data["cell_temperature"], column="temperature"
         )
+        self._daylight_totals = None
 
     def get_rating_description(self, score: float) -> str:
         if score >= 90:
@@ -56,26 +90,29 @@ class Analyzer:
             return (annual_energy_kwh / (peak_power_kw * 8760)) * 100
         return 0
 
+    def daylight_totals(self):
+        """Daylight sums shared by the performance ratio and utilization factor"""
+        if self._daylight_totals is None:
+            aligned = pd.concat(
+                [self.ac_power, self.poa_global, self.cell_temp], axis=1
+            ).to_numpy(dtype=np.float64)
+            self._daylight_totals = _daylight_kernel(
+                np.ascontiguousarray(aligned[:, 0]),
+                np.ascontiguousarray(aligned[:, 1]),
+                np.ascontiguousarray(aligned[:, 2]),
+            )
+        return self._daylight_totals
+
     def calculate_performance_ratio(self) -> float:
         """Calculate performance ratio (actual output / theoretical output)"""
         # Theoretical output based on irradiance and system characteristics
         # Simple theoretical model: power ≈ irradiance * temperature_factor
         # Temperature derating: typically -0.3% to -0.5% per °C above 25°C
-        temp_coeff = -0.004  # -0.4% per °C
-        temp_correction = 1 + (temp_coeff * (self.cell_temp - 25))
-
-        # Theoretical DC power (simplified)
-        theoretical_dc = self.poa_global * temp_correction
-
-        # Compare actual AC to theoretical DC (accounting for inverter efficiency)
-        actual_ac = self.ac_power
+        # Actual AC is compared to theoretical DC over daylight hours only
+        actual_ac, theoretical_dc, daylight_hours, _ = self.daylight_totals()
 
-        # Filter only daylight hours for meaningful comparison
-        daylight_mask = self.poa_global > 10  # W/m² threshold for daylight
-        if daylight_mask.any():
-            pr = (
-                actual_ac[daylight_mask].sum() / theoretical_dc[daylight_mask].sum()
-            ) * 100
+        if daylight_hours and theoretical_dc:
+            pr = (actual_ac / theoretical_dc) * 100
             return max(0, min(100, pr))  # Bound between 0-100%
         return 0
 
@@ -113,11 +150,10 @@ class Analyzer:
 
     def calculate_utilization_factor(self) -> float:
         """Calculate what percentage of daylight hours the system produces power"""
-        daylight_hours = self.poa_global > 10  # W/m² threshold
+        _, _, daylight_hours, producing_hours = self.daylight_totals()
 
-        if daylight_hours.any():
-            producing_hours = (self.ac_power > 0) & daylight_hours
-            return (producing_hours.sum() / daylight_hours.sum()) * 100
+        if daylight_hours:
+            return (producing_hours / daylight_hours) * 100
         return 0
 
     def calculate_score(self) -> Dict:
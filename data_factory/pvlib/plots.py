@@ -2,10 +2,12 @@
 ## pkibuka@milky-way.space
 
 import plotly.graph_objects as go
-from plotly.offline import plot
 import logging
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass, fields
+from functools import cached_property
+from data_factory.pvlib.utils import DARK_TEMPLATE, downsample_minmax
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,21 @@ def normalize_pv_tuple(data):
             else:
                 raise TypeError(f"Unexpected type in tuple: {type(d)}")
 
+        # Arrays sharing one index and column set (the usual case) are
+        # averaged in a single stacked numpy pass, skipping NaNs as groupby does
+        first = dfs[0]
+        if all(
+            d.index.equals(first.index) and d.columns.equals(first.columns)
+            for d in dfs[1:]
+        ):
+            stacked = np.stack([d.to_numpy(dtype=np.float64) for d in dfs])
+            counts = np.count_nonzero(~np.isnan(stacked), axis=0)
+            sums = np.nansum(stacked, axis=0)
+            means = np.divide(
+                sums, counts, out=np.full_like(sums, np.nan), where=counts > 0
+            )
+            return pd.DataFrame(means, index=first.index, columns=first.columns)
+
         # Align all DataFrames by columns, filling missing columns with NaN
         aligned = pd.concat(dfs, axis=0, keys=range(len(dfs)))
         # Compute mean per original column across arrays
@@ -43,23 +60,109 @@ def normalize_pv_tuple(data):
     if isinstance(data, pd.Series):
         return data.to_frame()
 
-    # Single DataFrame
+    # Single DataFrame (chart builders never modify their inputs, so no copy)
     if isinstance(data, pd.DataFrame):
-        return data.copy()
+        return data
 
     raise TypeError(f"Cannot normalize type: {type(data)}")
 
 
+def _day_hour_pivot(series):
+    """Mean of a series per (day of year, hour), days as rows and hours as columns"""
+    index = series.index
+    return series.groupby([index.dayofyear, index.hour]).mean().unstack()
+
+
+@dataclass
+class PlotData:
+    """
+    Normalized system-level frames for the modelchain charts, plus the
+    weekly/monthly/daily aggregates several charts share. Each aggregate
+    is computed once, on first use.
+    """
+
+    dc: pd.DataFrame
+    ac: pd.DataFrame
+    irr: pd.DataFrame
+    weather: pd.DataFrame
+    cell_temp: pd.DataFrame
+
+    # Shared aggregates, in the order they are defined below
+    AGGREGATES = (
+        "weekly_weather",
+        "weekly_dc",
+        "weekly_ac",
+        "weekly_irr",
+        "monthly_ac_kwh",
+        "daily_ac",
+        "daily_poa_mean",
+        "ac_day_hour",
+        "poa_day_hour",
+    )
+
+    def __getstate__(self):
+        # Only the base frames are pickled into the cache, not the aggregates
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+    @classmethod
+    def from_simulation(cls, simulation_data):
+        return cls(
+            dc=normalize_pv_tuple(simulation_data["dc"]),
+            ac=normalize_pv_tuple(simulation_data["ac_aoi"]),
+            irr=normalize_pv_tuple(simulation_data["irradiance"]),
+            weather=normalize_pv_tuple(simulation_data["weather"]),
+            cell_temp=normalize_pv_tuple(simulation_data["cell_temperature"]),
+        )
+
+    @cached_property
+    def weekly_weather(self):
+        return self.weather.resample("W-MON").mean()
+
+    @cached_property
+    def weekly_dc(self):
+        return self.dc.resample("W-MON").mean()
+
+    @cached_property
+    def weekly_ac(self):
+        return self.ac.resample("W-MON").mean()
+
+    @cached_property
+    def weekly_irr(self):
+        return self.irr.resample("W-MON").mean()
+
+    @cached_property
+    def monthly_ac_kwh(self):
+        return self.ac.groupby(self.ac.index.month)["ac"].sum() / 1000
+
+    @cached_property
+    def daily_ac(self):
+        return self.ac.groupby(self.ac.index.date)["ac"]
+
+    @cached_property
+    def daily_poa_mean(self):
+        return self.irr.groupby(self.irr.index.date)["poa_global"].mean()
+
+    @cached_property
+    def ac_day_hour(self):
+        return _day_hour_pivot(self.ac["ac"])
+
+    @cached_property
+    def poa_day_hour(self):
+        return _day_hour_pivot(self.irr["poa_global"])
+
+
 def chart(fig):
-    fig.update_layout(template="plotly_dark", margin=dict(l=40, r=20, t=50, b=40))
-    return plot(fig, output_type="div", include_plotlyjs=False)
+    """Figure JSON; the modelchain result template draws it with Plotly.react"""
+    fig.update_layout(template=DARK_TEMPLATE, margin=dict(l=40, r=20, t=50, b=40))
+    return fig.to_json()
 
 
 # ================================================================
 #   SOLAR GEOMETRY & IRRADIANCE
 # ================================================================
 def solar_elevation_chart(solar):
-    fig = go.Figure(go.Scatter(x=solar.index, y=solar["elevation"], mode="lines"))
+    elevation = downsample_minmax(solar["elevation"])
+    fig = go.Figure(go.Scatter(x=elevation.index, y=elevation, mode="lines"))
     fig.update_layout(
         title="Solar Elevation vs Time", xaxis_title="Time", yaxis_title="Elevation (°)"
     )
@@ -84,7 +187,7 @@ def sunpath_chart(solar):
 
 def poa_vs_ghi_chart(irradiance, weather):
     fig = go.Figure(
-        go.Scatter(
+        go.Scattergl(
             x=irradiance["poa_global"], y=weather["ghi"], mode="markers", opacity=0.5
         )
     )
@@ -94,8 +197,7 @@ def poa_vs_ghi_chart(irradiance, weather):
     return chart(fig)
 
 
-def irradiance_breakdown_chart(weather):
-    weekly_weather = weather.resample("W-MON").mean()
+def irradiance_breakdown_chart(weekly_weather):
     fig = go.Figure()
     for comp in ["ghi", "dni", "dhi"]:
         if comp in weekly_weather.columns:
@@ -115,11 +217,7 @@ def irradiance_breakdown_chart(weather):
     return chart(fig)
 
 
-def poa_heatmap(irradiance):
-    df = irradiance.copy()
-    df["day"] = df.index.dayofyear
-    df["hour"] = df.index.hour
-    pivot = df.pivot_table(index="day", columns="hour", values="poa_global")
+def poa_heatmap(pivot):
     fig = go.Figure(
         go.Heatmap(
             z=pivot.values, x=pivot.columns, y=pivot.index, colorbar=dict(title="W/m²")
@@ -136,8 +234,7 @@ def poa_heatmap(irradiance):
 # ================================================================
 #   METEOROLOGICAL CONDITIONS
 # ================================================================
-def temp_wind_chart(weather):
-    weekly_weather = weather.resample("W-MON").mean()
+def temp_wind_chart(weekly_weather):
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
@@ -162,7 +259,7 @@ def temp_wind_chart(weather):
 def temp_vs_irradiance(cell_temp, irradiance):
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=irradiance["poa_global"],
             y=cell_temp["temperature"],
             mode="markers",
@@ -181,7 +278,7 @@ def temp_vs_irradiance(cell_temp, irradiance):
 def temp_derating(cell_temp, dc):
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=cell_temp["temperature"], y=dc["p_mp"], mode="markers", opacity=0.5
         )
     )
@@ -199,7 +296,7 @@ def temp_derating(cell_temp, dc):
 def dc_vs_irradiance(dc, irr):
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(x=irr["poa_global"], y=dc["p_mp"], mode="markers", opacity=0.5)
+        go.Scattergl(x=irr["poa_global"], y=dc["p_mp"], mode="markers", opacity=0.5)
     )
     fig.update_layout(
         title="DC Power vs Irradiance",
@@ -212,7 +309,7 @@ def dc_vs_irradiance(dc, irr):
 def dc_vs_ac(dc, ac):
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(x=dc["p_mp"], y=ac["ac"], mode="markers", name="DC/AC", opacity=0.5)
+        go.Scattergl(x=dc["p_mp"], y=ac["ac"], mode="markers", name="DC/AC", opacity=0.5)
     )
     fig.update_layout(
         title="DC vs AC Power", xaxis_title="DC Power (W)", yaxis_title="AC Power (W)"
@@ -224,7 +321,7 @@ def inverter_efficiency(dc, ac):
     fig = go.Figure()
     efficiency = ac["ac"] / dc["p_mp"]
     fig.add_trace(
-        go.Scatter(x=dc["p_mp"], y=efficiency, mode="markers", name="", opacity=0.4)
+        go.Scattergl(x=dc["p_mp"], y=efficiency, mode="markers", name="", opacity=0.4)
     )
     fig.update_layout(
         title="Inverter Efficiency Curve",
@@ -234,9 +331,7 @@ def inverter_efficiency(dc, ac):
     return chart(fig)
 
 
-def power_timeseries(dc, ac):
-    weekly_dc = dc.resample("W-MON").mean()
-    weekly_ac = ac.resample("W-MON").mean()
+def power_timeseries(weekly_dc, weekly_ac):
     fig = go.Figure()
     fig.add_trace(go.Scatter(x=weekly_dc.index, y=weekly_dc["p_mp"], name="DC Power"))
     fig.add_trace(go.Scatter(x=weekly_ac.index, y=weekly_ac["ac"], name="AC Power"))
@@ -248,9 +343,8 @@ def power_timeseries(dc, ac):
     return chart(fig)
 
 
-def monthly_yield(ac):
+def monthly_yield(monthly):
     fig = go.Figure()
-    monthly = ac.groupby(ac.index.month)["ac"].sum() / 1000
     fig.add_trace(go.Bar(x=monthly.index, y=monthly.values, name=""))
     fig.update_layout(
         title="Monthly Energy Yield", xaxis_title="Month", yaxis_title="Energy (kWh)"
@@ -258,12 +352,8 @@ def monthly_yield(ac):
     return chart(fig)
 
 
-def power_heatmap(ac):
-    df = ac.copy()
-    df["day"] = df.index.dayofyear
-    df["hour"] = df.index.hour
+def power_heatmap(pivot):
     fig = go.Figure()
-    pivot = df.pivot_table(index="day", columns="hour", values="ac")
     fig.add_trace(
         go.Heatmap(
             z=pivot.values,
@@ -286,10 +376,9 @@ def power_heatmap(ac):
 # ================================================================
 
 
-def peak_power_vs_irradiance(ac, irradiance):
+def peak_power_vs_irradiance(daily_ac, mean_irr):
     fig = go.Figure()
-    daily_peak = ac.groupby(ac.index.date)["ac"].max()
-    mean_irr = irradiance.groupby(irradiance.index.date)["poa_global"].mean()
+    daily_peak = daily_ac.max()
     fig.add_trace(go.Scatter(x=mean_irr, y=daily_peak, mode="markers", name=""))
     fig.update_layout(
         title="Daily Peak Power vs Irradiance",
@@ -302,8 +391,8 @@ def peak_power_vs_irradiance(ac, irradiance):
 # ================================================================
 #   TEMPORAL & ENERGY SUMMARY
 # ================================================================
-def daily_yield(ac):
-    daily = ac.groupby(ac.index.date)["ac"].sum() / 1000
+def daily_yield(daily_ac):
+    daily = daily_ac.sum() / 1000
     fig = go.Figure()
     fig.add_trace(go.Scatter(x=daily.index, y=daily.values, mode="lines", name=""))
     fig.update_layout(
@@ -312,8 +401,7 @@ def daily_yield(ac):
     return chart(fig)
 
 
-def capacity_factor(ac):
-    monthly = ac.groupby(ac.index.month)["ac"].sum() / 1000
+def capacity_factor(monthly):
     cap_factor = monthly / monthly.max()
     fig = go.Figure()
     fig.add_trace(go.Bar(x=cap_factor.index, y=cap_factor.values, name=""))
@@ -326,19 +414,20 @@ def capacity_factor(ac):
 
 
 def cumulative_energy(ac):
-    cumulative = ac["ac"].cumsum() / 1000
+    cumulative = downsample_minmax(ac["ac"].cumsum() / 1000)
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=ac.index, y=cumulative, mode="lines", name=""))
+    fig.add_trace(
+        go.Scatter(x=cumulative.index, y=cumulative, mode="lines", name="")
+    )
     fig.update_layout(
         title="Cumulative Energy (kWh)", xaxis_title="Time", yaxis_title="kWh"
     )
     return chart(fig)
 
 
-def performance_ratio(ac, irradiance):
-    ac = ac.resample("W-MON").mean()
-    irradiance = irradiance.resample("W-MON").mean()
-    pr = ac["ac"] / irradiance["poa_global"]
+def performance_ratio(weekly_ac, weekly_irr):
+    ac = weekly_ac
+    pr = ac["ac"] / weekly_irr["poa_global"]
     fig = go.Figure()
     fig.add_trace(go.Scatter(x=ac.index, y=pr, mode="lines", name=""))
     fig.update_layout(
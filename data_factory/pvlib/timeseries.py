@@ -1,6 +1,8 @@
 import plotly.graph_objects as go
-from plotly.offline import plot
 import pandas as pd
+import json
+import uuid
+from data_factory.pvlib import utils
 
 
 # def _get_array_data(df, array, param):
@@ -72,81 +74,94 @@ def _prepare_and_resample_data(df, param):
         return df[param]
 
 
+# Pre-rendered "no data" chart; the div id and title are filled in per call
+_EMPTY_CHART = go.Figure(
+    layout=dict(title="__TITLE__", template=utils.DARK_TEMPLATE)
+).to_html(full_html=False, include_plotlyjs=False, div_id="__DIV_ID__")
+
+_LAYOUT = dict(
+    template=utils.DARK_TEMPLATE,
+    xaxis_title="Day",
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+)
+
+
+def _empty_chart(title):
+    """
+    Helper function to fill the pre-rendered empty chart for a title.
+    """
+    # JSON-escape the title the same way Plotly does for inline scripts
+    text = json.dumps(f"No data available for '{title}'")[1:-1]
+    text = text.replace("<", "\\u003c").replace(">", "\\u003e").replace("/", "\\u002f")
+    return _EMPTY_CHART.replace("__DIV_ID__", uuid.uuid4().hex).replace(
+        "__TITLE__", text
+    )
+
+
 def _plot_timeseries(series, title, y_axis_title=None):
     """
     Helper function to create a Plotly chart from a time series.
     """
-    # Handle all-NaN case
-    if series.isna().all():
-        fig = go.Figure()
-        fig.update_layout(
-            title=f"No data available for '{title}'", template="plotly_dark"
-        )
-        return plot(fig, output_type="div", include_plotlyjs=False)
+    series = utils.downsample_minmax(series)
+    values = series.to_numpy()
+
+    # Handle all-NaN case (checked on the raw array, no intermediate Series)
+    if pd.isna(values).all():
+        return _empty_chart(title)
 
     # Plot the data
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
             x=series.index,
-            y=series.values,
+            y=values,
             mode="lines",
             connectgaps=True,
             name=f"Avg Daily {title}",
         )
     )
 
-    y_axis_title = y_axis_title or title
+    fig.update_layout(**_LAYOUT, title=title, yaxis_title=y_axis_title or title)
+
+    return fig.to_html(full_html=False, include_plotlyjs=False)
 
-    fig.update_layout(
-        template="plotly_dark",
-        title=title,
-        xaxis_title="Day",
-        yaxis_title=y_axis_title,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    )
 
-    return plot(fig, output_type="div", include_plotlyjs=False)
+def _array_chart(data, array, param, title, y_axis_title=None):
+    """
+    Helper function to plot the daily average of one parameter of an array.
+    """
+    series = _get_array_data(data, array, param)
+    daily_avg = _prepare_and_resample_data(series, param)
+    return _plot_timeseries(daily_avg, title, y_axis_title)
 
 
 def ac_aoi_chart(ac_aoi, array, param):
     """Plot the average daily AC power for a given array."""
-    data = _get_array_data(ac_aoi, array, param)
-    daily_avg = _prepare_and_resample_data(data, param)
     title = f"{array}, Daily {param.upper()}"
-    y_axis_title = f"{param.upper()} (W)"
-    return _plot_timeseries(daily_avg, title, y_axis_title)
+    return _array_chart(ac_aoi, array, param, title, f"{param.upper()} (W)")
 
 
 def cell_temp_chart(cell_temp, array):
     """Plot cell temperature data."""
-    data = _get_array_data(cell_temp, array, "temperature")
-    daily_avg = _prepare_and_resample_data(data, "temperature")
     title = f"{array}, Cell Temperature"
-    return _plot_timeseries(daily_avg, title, "Temperature (°C)")
+    return _array_chart(cell_temp, array, "temperature", title, "Temperature (°C)")
 
 
 def dc_output_chart(dc_output, array, param):
     """Plot DC output parameters."""
-    data = _get_array_data(dc_output, array, param)
-    daily_avg = _prepare_and_resample_data(data, param)
     title = f"{array}, {param.upper()}"
-    return _plot_timeseries(daily_avg, title, f"{param} (W)")
+    return _array_chart(dc_output, array, param, title, f"{param} (W)")
 
 
 def diode_params_chart(diode_params, array, param):
     """Plot diode parameters."""
-    data = _get_array_data(diode_params, array, param)
-    daily_avg = _prepare_and_resample_data(data, param)
-    return _plot_timeseries(daily_avg, f"{array}, {param.upper()}")
+    return _array_chart(diode_params, array, param, f"{array}, {param.upper()}")
 
 
 def total_irradiance_chart(total_irradiance, array, param):
     """Plot total irradiance parameters."""
-    data = _get_array_data(total_irradiance, array, param)
-    daily_avg = _prepare_and_resample_data(data, param)
     title = f"{array}, {param.upper()}"
-    return _plot_timeseries(daily_avg, title, "Irradiance (W/m²)")
+    return _array_chart(total_irradiance, array, param, title, "Irradiance (W/m²)")
 
 
 def solar_position_chart(solar_position, param):
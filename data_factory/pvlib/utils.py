@@ -3,10 +3,19 @@
 
 
 import pvlib
+import numpy as np
 import pandas as pd
+import plotly.io as pio
 from django.core.cache import cache
 
 
+# Resolved once so chart builders don't look the named template up per figure
+DARK_TEMPLATE = pio.templates["plotly_dark"]
+
+# Upper bound on points per plotted line; browsers gain nothing beyond this
+MAX_CHART_POINTS = 2000
+
+
 def fetch_TMY_data(lat, lon, year):
     """
     Fetches PVGIS TMY data for the specified coordinates and year.
@@ -71,3 +80,27 @@ def aggregate_timeseries(data, column: str = None):
         return series_list[0]
     else:
         return pd.concat(series_list, axis=1).mean(axis=1)
+
+
+def downsample_minmax(series, max_points: int = MAX_CHART_POINTS):
+    """
+    Thin a series to at most max_points for plotting. Each bucket keeps its
+    minimum and maximum sample, so peaks and troughs survive the reduction.
+    """
+    n = len(series)
+    if n <= max_points:
+        return series
+
+    bucket = -(-2 * n // max_points)  # ceil, two samples kept per bucket
+    values = series.to_numpy(dtype=float)
+    grid = np.pad(values, (0, (-n) % bucket), constant_values=np.nan)
+    grid = grid.reshape(-1, bucket)
+
+    # NaNs never win, so an all-NaN bucket just keeps its first sample
+    missing = np.isnan(grid)
+    lows = np.where(missing, np.inf, grid).argmin(axis=1)
+    highs = np.where(missing, -np.inf, grid).argmax(axis=1)
+
+    offsets = np.arange(grid.shape[0]) * bucket
+    keep = np.unique(np.concatenate([lows + offsets, highs + offsets]))
+    return series.iloc[keep[keep < n]]
@@ -4,13 +4,14 @@
 from data_factory.pvwatts.base_forecast import FetchNRELData
 from data_factory.pvwatts.location_scoring import LocationScorer
 
-from typing import Dict
+from typing import Dict, Optional
 
 
 class ComparativeAnalysis:
-    def __init__(self, locations, config: Dict):
+    def __init__(self, locations, config: Dict, base_forecasts: Optional[Dict] = None):
         self.locations = locations
         self.config = config
+        self.base_forecasts = base_forecasts or {}
 
     def run_comparative_analysis(self) -> Dict:
         """Compare all added locations"""
@@ -20,8 +21,10 @@ class ComparativeAnalysis:
         comparisons = []
         for name, location in self.locations.items():
 
-            nrel_api = FetchNRELData(location, system_config=self.config)
-            base_data = nrel_api.get_base_forecast()
+            base_data = self.base_forecasts.get(name)
+            if base_data is None:
+                nrel_api = FetchNRELData(location, system_config=self.config)
+                base_data = nrel_api.get_base_forecast()
 
             ls = LocationScorer(base_data)
             score = ls.calculate_location_score()
@@ -4,8 +4,9 @@
 import pandas as pd
 import numpy as np
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decouple import config
 
@@ -47,13 +48,16 @@ class PVWattsSimulator:
         system_cost: float = 50000,
         electricity_rate: float = 0.15,
         grid_carbon_intensity: float = 0.4,
+        base_data: Optional[Dict] = None,
+        comparative_analysis: Optional[Any] = None,
     ) -> Dict[str, Any]:
         """Main Unified Method"""
         location = self.locations[location_name]
-        nrel_api = FetchNRELData(location=location, system_config=config)
 
         # Base energy forecast data
-        base_data = nrel_api.get_base_forecast()
+        if base_data is None:
+            nrel_api = FetchNRELData(location=location, system_config=config)
+            base_data = nrel_api.get_base_forecast()
 
         # Scenario Modelling
         sm = ScenarioModelling(location)
@@ -80,8 +84,9 @@ class PVWattsSimulator:
         system_recommendations = sr.generate_sys_recommendations()
 
         # Comparative Analysis (locations)
-        ca = ComparativeAnalysis(self.locations, config)
-        comparative_analysis = ca.run_comparative_analysis()
+        if comparative_analysis is None:
+            ca = ComparativeAnalysis(self.locations, config)
+            comparative_analysis = ca.run_comparative_analysis()
 
         report = {
             "location_info": {
@@ -99,3 +104,43 @@ class PVWattsSimulator:
         }
 
         return report
+
+    def generate_reports(
+        self, location_names: List[str], config: Dict
+    ) -> List[Dict[str, Any]]:
+        """Reports for several locations, fetching each base forecast once"""
+        if not location_names:
+            return []
+
+        workers = min(8, len(self.locations))
+
+        # Every base forecast is one NREL round-trip, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            forecasts = dict(
+                zip(
+                    self.locations,
+                    executor.map(
+                        lambda location: FetchNRELData(
+                            location=location, system_config=config
+                        ).get_base_forecast(),
+                        self.locations.values(),
+                    ),
+                )
+            )
+
+        # The comparison covers all locations, so it is the same for every report
+        ca = ComparativeAnalysis(self.locations, config, base_forecasts=forecasts)
+        comparative_analysis = ca.run_comparative_analysis()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda name: self.generate_report(
+                        name,
+                        config=config,
+                        base_data=forecasts[name],
+                        comparative_analysis=comparative_analysis,
+                    ),
+                    location_names,
+                )
+            )
@@ -19,6 +19,7 @@ from data_factory.database.connection import DatabaseConnection
 from data_factory.database.manager import DataManager
 from decouple import config
 from data_factory.apis import data_utils
+from data_factory.pvlib import fixed_mount_simulator
 
 logger = logging.getLogger(__name__)
 
@@ -90,13 +91,11 @@ def fetch_nasa_data(self):
     df = process_nasa_data(data)
 
     try:
-        conn = DatabaseConnection()
-        db = DataManager(conn)
         df_filtered = df[df["parameter"] == "ALLSKY_SFC_SW_DWN"]
 
         if not df_filtered.empty:
-            db.insert_irradiance_data(df_filtered)
-            db.close()
+            with DataManager(DatabaseConnection()) as db:
+                db.insert_irradiance_data(df_filtered)
 
     except Exception as e:
         logger.error(f"Failed to save to db: {e}")
@@ -226,24 +225,20 @@ def fetch_openmeteo_weather(self):
     responses = openmeteo.weather_api(url, params=params)
     response = responses[0]
 
-    conn = DatabaseConnection()
-    db = DataManager(conn)
-
-    location_idx = db.get_or_create_location(
-        provider="openmeteo",
-        latitude=lat,
-        longitude=lon,
-        elevation_m=response.Elevation(),
-        timezone=response.Timezone(),
-        tz_abbreviation=response.TimezoneAbbreviation(),
-        utc_offset_secs=response.UtcOffsetSeconds(),
-        model="best_match",
-    )
-
     current_df, hourly_df, daily_df = data_utils.process_openmeteo_weather(response)
 
-    db.insert_openmeteo_data(location_idx, current_df, hourly_df, daily_df)
-    db.close()
+    with DataManager(DatabaseConnection()) as db:
+        location_idx = db.get_or_create_location(
+            provider="openmeteo",
+            latitude=lat,
+            longitude=lon,
+            elevation_m=response.Elevation(),
+            timezone=response.Timezone(),
+            tz_abbreviation=response.TimezoneAbbreviation(),
+            utc_offset_secs=response.UtcOffsetSeconds(),
+            model="best_match",
+        )
+        db.insert_openmeteo_data(location_idx, current_df, hourly_df, daily_df)
 
 
 @shared_task(bind=True)
@@ -292,25 +287,49 @@ def fetch_openmeteo_airquality(self):
     # Process first location. Add a for-loop for multiple locations or weather models
     response = responses[0]
 
-    conn = DatabaseConnection()
-    db = DataManager(conn)
-
-    location_idx = db.get_or_create_location(
-        provider="openmeteo",
-        latitude=lat,
-        longitude=lon,
-        elevation_m=response.Elevation(),
-        timezone=response.Timezone(),
-        tz_abbreviation=response.TimezoneAbbreviation(),
-        utc_offset_secs=response.UtcOffsetSeconds(),
-        model="best_match",
-    )
-
     current_df, hourly_df = data_utils.process_airquality_data(response)
 
-    db.insert_air_quality_data(location_idx, current_df, hourly_df)
-    db.close()
+    with DataManager(DatabaseConnection()) as db:
+        location_idx = db.get_or_create_location(
+            provider="openmeteo",
+            latitude=lat,
+            longitude=lon,
+            elevation_m=response.Elevation(),
+            timezone=response.Timezone(),
+            tz_abbreviation=response.TimezoneAbbreviation(),
+            utc_offset_secs=response.UtcOffsetSeconds(),
+            model="best_match",
+        )
+        db.insert_air_quality_data(location_idx, current_df, hourly_df)
 
     print(f"Coordinates: {response.Latitude()}°N {response.Longitude()}°E")
     print(f"Elevation: {response.Elevation()} m asl")
     print(f"Timezone difference to GMT+0: {response.UtcOffsetSeconds()}s")
+
+
+@shared_task(bind=True)
+def run_fixed_mount_simulation(
+    self,
+    location_params,
+    system_params,
+    losses_params,
+    array_names,
+    simulation_name,
+    description,
+):
+    fms = fixed_mount_simulator.FixedMountSimulator(
+        location_params=location_params,
+        system_params=system_params,
+        losses_params=losses_params,
+    )
+    result = fms.run_simulation()
+
+    with DataManager(DatabaseConnection()) as db:
+        result_id = db.save_modelchain_result(
+            result=result,
+            array_names=array_names,
+            simulation_name=simulation_name,
+            description=description,
+        )
+
+    return result_id
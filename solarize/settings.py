@@ -188,6 +188,20 @@ CACHES = {
         "LOCATION": "redis://127.0.0.1:6379/1",
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # Simulation results are multi-MB pickles of float arrays
+            "COMPRESSOR": "django_redis.compressors.zstd.ZStdCompressor",
         },
     },
 }
+
+# Worker threads shared by views that fan out chart and analysis work
+ANALYTICS_THREADS = config("ANALYTICS_THREADS", default=8, cast=int)
+
+# psycopg2 pool behind data_factory.database.connection, one per process.
+# Size DB_POOL_MAX for the request threads plus ANALYTICS_THREADS and the
+# PVWatts executors that may each hold a connection at the same time.
+# Checkouts beyond it wait up to DB_POOL_WAIT seconds, then open a direct
+# connection that is closed on release instead of pooled.
+DB_POOL_MIN = config("DB_POOL_MIN", default=1, cast=int)
+DB_POOL_MAX = config("DB_POOL_MAX", default=20, cast=int)
+DB_POOL_WAIT = config("DB_POOL_WAIT", default=5, cast=float)
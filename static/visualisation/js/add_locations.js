@@ -18,19 +18,19 @@
                         <div class="col-md-12">
                             <label for="locationName_${newIndex}" class="form-label">Location Name</label>
                             <input type="text" class="form-control location-name" id="locationName_${newIndex}" 
-                                   name="locations[${newIndex}][name]" placeholder="e.g., London" value="" required>
+                                   name="locations[][name]" placeholder="e.g., London" value="" required>
                         </div>
                         
                         <div class="col-md-6">
                             <label for="lat_${newIndex}" class="form-label">Latitude</label>
                             <input type="number" class="form-control" id="lat_${newIndex}" 
-                                   name="locations[${newIndex}][lat]" step="any" placeholder="Enter latitude" required>
+                                   name="locations[][lat]" step="any" placeholder="Enter latitude" required>
                         </div>
                         
                         <div class="col-md-6">
                             <label for="lon_${newIndex}" class="form-label">Longitude</label>
                             <input type="number" class="form-control" id="lon_${newIndex}" 
-                                   name="locations[${newIndex}][lon]" step="any" placeholder="Enter longitude" required>
+                                   name="locations[][lon]" step="any" placeholder="Enter longitude" required>
                         </div>
                     </div>
                 </div>
@@ -66,12 +66,9 @@
                 location.setAttribute('data-location-index', index);
                 location.querySelector('h6').textContent = `Location #${index + 1}`;
                 
-                // Update input names and IDs
+                // Update input IDs (names are positional, so they need no re-indexing)
                 const inputs = location.querySelectorAll('input');
                 inputs.forEach(input => {
-                    const oldName = input.name;
-                    const newName = oldName.replace(/locations\[\d+\]/, `locations[${index}]`);
-                    input.name = newName;
                     input.id = input.id.replace(/_(\d+)_/, `_${index}_`);
                 });
             });
@@ -0,0 +1,46 @@
+document.addEventListener("DOMContentLoaded", () => {
+  const chart = document.getElementById("irr-chart");
+  if (!chart) return;
+
+  fetch(chart.dataset.url)
+    .then(response => response.json())
+    .then(data => {
+      if (!data.bucket) {
+        chart.innerHTML = "<p>No data available</p>";
+        return;
+      }
+
+      // Each bar is a segment; null breaks the line between bars
+      const wicks = { x: [], y: [] };
+      const rising = { x: [], y: [] };
+      const falling = { x: [], y: [] };
+
+      data.bucket.forEach((bucket, i) => {
+        const body = data.close[i] >= data.open[i] ? rising : falling;
+
+        wicks.x.push(bucket, bucket, null);
+        wicks.y.push(data.low[i], data.high[i], null);
+        body.x.push(bucket, bucket, null);
+        body.y.push(data.open[i], data.close[i], null);
+      });
+
+      const traces = [
+        { ...wicks, type: "scattergl", mode: "lines", name: "High/Low", line: { color: "#9e9e9e", width: 1 } },
+        { ...rising, type: "scattergl", mode: "lines", name: "Rising", line: { color: "#26a69a", width: 8 } },
+        { ...falling, type: "scattergl", mode: "lines", name: "Falling", line: { color: "#ef5350", width: 8 } },
+      ];
+
+      const layout = {
+        font: { color: "#f2f5f9" },
+        paper_bgcolor: "rgba(0,0,0,0)",
+        plot_bgcolor: "rgba(0,0,0,0)",
+        xaxis: { title: { text: "Date" }, type: "date", gridcolor: "#283442" },
+        yaxis: { title: { text: "kWh/m²/day" }, gridcolor: "#283442" },
+        showlegend: false,
+        margin: { t: 20 },
+      };
+
+      Plotly.react(chart, traces, layout, { responsive: true });
+    })
+    .catch(error => console.error("Irradiance chart error:", error));
+});